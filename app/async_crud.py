@@ -0,0 +1,487 @@
+"""
+Async data access for the hot read endpoints (cards, decks, search and
+draft review). Queries go through pymongo's AsyncMongoClient and map the
+raw documents straight to response schemas, so these routes run on the
+event loop instead of occupying a threadpool worker per request.
+
+Writes still go through the mongoengine layer in crud.py.
+"""
+
+import re
+from datetime import datetime
+
+from bson import ObjectId
+from fastapi import HTTPException
+from pymongo.asynchronous.database import AsyncDatabase
+
+from . import schemas
+from .crud import (
+    BOOK_FIELDS,
+    CARD_FIELDS,
+    CARD_RESPONSE_FIELDS,
+    DECK_FIELDS,
+    DRAFT_FIELDS,
+    DRAFT_RESPONSE_FIELDS,
+    _book_raw_to_response,
+    _card_raw_to_response,
+    _deck_raw_to_response,
+    _deck_summary_raw_to_response,
+    _draft_raw_to_response,
+    _template_raw_to_response,
+    parse_cursor,
+    parse_offset_cursor,
+    projection,
+    select_fields,
+)
+from .models import Book, Card, Deck, DraftCard, Template, User
+
+
+def _cards(db: AsyncDatabase):
+    return db[Card._get_collection_name()]
+
+
+def _decks(db: AsyncDatabase):
+    return db[Deck._get_collection_name()]
+
+
+def _drafts(db: AsyncDatabase):
+    return db[DraftCard._get_collection_name()]
+
+
+def _templates(db: AsyncDatabase):
+    return db[Template._get_collection_name()]
+
+
+def _books(db: AsyncDatabase):
+    return db[Book._get_collection_name()]
+
+
+async def _attach_includes(
+    items: list,
+    include: frozenset[str],
+    db: AsyncDatabase,
+    owner: User,
+    book_id_attr: str = "source_book_id",
+    book_attr: str = "source_book",
+) -> None:
+    """
+    Embeds the templates and/or books referenced by a page of cards or
+    drafts, with one $in query per referenced collection. Cards and drafts
+    name the book reference differently, hence ``book_id_attr``/``book_attr``.
+    """
+    if not items:
+        return
+    if "template" in include:
+        template_ids = {
+            ObjectId(item.template_id) for item in items if item.template_id
+        }
+        templates = {}
+        if template_ids:
+            async for raw in _templates(db).find(
+                {
+                    "_id": {"$in": list(template_ids)},
+                    "$or": [{"owner": owner.id}, {"is_default": True}],
+                }
+            ):
+                templates[str(raw["_id"])] = _template_raw_to_response(raw)
+        for item in items:
+            item.template = templates.get(item.template_id)
+    if "book" in include:
+        book_ids = {
+            ObjectId(getattr(item, book_id_attr))
+            for item in items
+            if getattr(item, book_id_attr)
+        }
+        books = {}
+        if book_ids:
+            async for raw in _books(db).find(
+                {"_id": {"$in": list(book_ids)}, "owner": owner.id},
+                projection(BOOK_FIELDS),
+            ):
+                books[str(raw["_id"])] = _book_raw_to_response(raw)
+        for item in items:
+            setattr(item, book_attr, books.get(getattr(item, book_id_attr)))
+
+
+async def _keyset_page(
+    collection,
+    filter_: dict,
+    fields: tuple[str, ...],
+    skip: int,
+    limit: int,
+    cursor: str | None,
+) -> tuple[list[dict], str | None]:
+    """
+    One page of raw documents sorted by _id, starting after ``cursor``,
+    plus the cursor for the following page (None on the last page).
+    """
+    after = parse_cursor(cursor)
+    if after:
+        filter_ = {**filter_, "_id": {"$gt": after}}
+    raws = await (
+        collection.find(filter_, projection(fields))
+        .sort("_id", 1)
+        .skip(skip)
+        .limit(limit + 1)
+        .to_list()
+    )
+    next_cursor = str(raws[limit - 1]["_id"]) if len(raws) > limit else None
+    return raws[:limit], next_cursor
+
+
+async def _decks_to_response(
+    deck_raws: list[dict],
+    db: AsyncDatabase,
+    owner: User,
+    include: frozenset[str] = frozenset(),
+    fields: frozenset[str] | None = None,
+) -> list[schemas.Deck]:
+    """
+    Resolves the cards of every deck on the page with one $in query,
+    loading only the card ``fields`` when a sparse fieldset is requested.
+    """
+    card_ids = {card_id for raw in deck_raws for card_id in raw.get("cards") or []}
+    card_fields = select_fields(fields, CARD_RESPONSE_FIELDS, CARD_FIELDS)
+    cards_by_id = {}
+    if card_ids:
+        async for card_raw in _cards(db).find(
+            {"_id": {"$in": list(card_ids)}, "owner": owner.id}, projection(card_fields)
+        ):
+            cards_by_id[card_raw["_id"]] = _card_raw_to_response(card_raw)
+    await _attach_includes(list(cards_by_id.values()), include, db, owner)
+    return [_deck_raw_to_response(raw, cards_by_id) for raw in deck_raws]
+
+
+# ---- Cards ----
+
+
+async def get_card(
+    card_id: str,
+    db: AsyncDatabase,
+    owner: User = None,
+    include: frozenset[str] = frozenset(),
+) -> schemas.Card | None:
+    try:
+        raw = await _cards(db).find_one(
+            {"_id": ObjectId(card_id), "owner": owner.id}, projection(CARD_FIELDS)
+        )
+        if not raw:
+            return None
+        card = _card_raw_to_response(raw)
+        await _attach_includes([card], include, db, owner)
+        return card
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+async def list_cards(
+    skip: int,
+    limit: int,
+    db: AsyncDatabase,
+    owner: User = None,
+    include: frozenset[str] = frozenset(),
+    cursor: str | None = None,
+    fields: frozenset[str] | None = None,
+) -> tuple[list[schemas.Card], str | None]:
+    try:
+        raws, next_cursor = await _keyset_page(
+            _cards(db),
+            {"owner": owner.id},
+            select_fields(fields, CARD_RESPONSE_FIELDS, CARD_FIELDS),
+            skip,
+            limit,
+            cursor,
+        )
+        cards = [_card_raw_to_response(raw) for raw in raws]
+        await _attach_includes(cards, include, db, owner)
+        return cards, next_cursor
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+# ---- Review ----
+
+
+async def list_due_cards(
+    deck_id: str | None, limit: int, db: AsyncDatabase, owner: User = None
+) -> list[schemas.Card] | None:
+    """
+    The owner's most overdue cards, oldest ``next_due`` first, read with
+    one range scan of the (owner, next_due) index. Cards created before
+    the scheduler existed have no ``next_due`` until ``python -m
+    app.indexes`` backfills it; they count as due and sort first. With
+    ``deck_id`` the scan is restricted to that deck's cards; None if the
+    deck is missing.
+    """
+    try:
+        filter_ = {
+            "owner": owner.id,
+            "$or": [{"next_due": {"$lte": datetime.utcnow()}}, {"next_due": None}],
+        }
+        if deck_id is not None:
+            deck = await _decks(db).find_one(
+                {"_id": ObjectId(deck_id), "owner": owner.id}, {"cards": 1}
+            )
+            if deck is None:
+                return None
+            filter_["_id"] = {"$in": deck.get("cards") or []}
+        raws = await (
+            _cards(db)
+            .find(filter_, projection(CARD_FIELDS))
+            .sort("next_due", 1)
+            .limit(limit)
+            .to_list(length=None)
+        )
+        return [_card_raw_to_response(raw) for raw in raws]
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+# ---- Decks ----
+
+
+async def get_deck(
+    deck_id: str,
+    db: AsyncDatabase,
+    owner: User = None,
+    include: frozenset[str] = frozenset(),
+    fields: frozenset[str] | None = None,
+) -> schemas.Deck | None:
+    try:
+        raw = await _decks(db).find_one(
+            {"_id": ObjectId(deck_id), "owner": owner.id}, projection(DECK_FIELDS)
+        )
+        if not raw:
+            return None
+        return (await _decks_to_response([raw], db, owner, include, fields))[0]
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+# Hardest first. Cards without a hardness_level rank with medium, the default.
+_HARDNESS_RANK = {
+    "$switch": {
+        "branches": [
+            {
+                "case": {"$eq": ["$hardness_level", schemas.HardnessLevel.HARD.value]},
+                "then": 0,
+            },
+            {
+                "case": {"$eq": ["$hardness_level", schemas.HardnessLevel.EASY.value]},
+                "then": 2,
+            },
+        ],
+        "default": 1,
+    }
+}
+
+
+async def list_deck_cards(
+    deck_id: str,
+    limit: int,
+    db: AsyncDatabase,
+    owner: User = None,
+    sort: str = "position",
+    cursor: str | None = None,
+    include: frozenset[str] = frozenset(),
+    fields: frozenset[str] | None = None,
+) -> tuple[list[schemas.Card], str | None] | None:
+    """
+    One page of a deck's cards, or None if the deck doesn't exist.
+
+    In deck order (``position``) only that page of references is read,
+    with $slice, and its cards are loaded with one $in query. ``hardness``
+    (hardest first) and ``last_visited`` (least recently visited first)
+    sort the deck's cards in one aggregation. All orders page with an
+    offset cursor.
+    """
+    try:
+        offset = parse_offset_cursor(cursor)
+        card_fields = projection(
+            select_fields(fields, CARD_RESPONSE_FIELDS, CARD_FIELDS)
+        )
+        deck_filter = {"_id": ObjectId(deck_id), "owner": owner.id}
+        if sort == "position":
+            deck = await _decks(db).find_one(
+                deck_filter, {"_id": 1, "cards": {"$slice": [offset, limit + 1]}}
+            )
+            if deck is None:
+                return None
+            page_ids = (deck.get("cards") or [])[: limit + 1]
+            has_more = len(page_ids) > limit
+            page_ids = page_ids[:limit]
+            cards_by_id = {}
+            if page_ids:
+                async for raw in _cards(db).find(
+                    {"_id": {"$in": page_ids}, "owner": owner.id}, card_fields
+                ):
+                    cards_by_id[raw["_id"]] = raw
+            raws = [
+                cards_by_id[card_id] for card_id in page_ids if card_id in cards_by_id
+            ]
+        else:
+            deck = await _decks(db).find_one(deck_filter, {"cards": 1})
+            if deck is None:
+                return None
+            pipeline = [
+                {"$match": {"_id": {"$in": deck.get("cards") or []}, "owner": owner.id}}
+            ]
+            if sort == "hardness":
+                pipeline.append({"$addFields": {"hardness_rank": _HARDNESS_RANK}})
+                order = {"hardness_rank": 1, "_id": 1}
+            else:
+                order = {"last_visited": 1, "_id": 1}
+            pipeline.append({"$sort": order})
+            if offset:
+                pipeline.append({"$skip": offset})
+            pipeline += [{"$limit": limit + 1}, {"$project": card_fields}]
+            raws = await (await _cards(db).aggregate(pipeline)).to_list()
+            has_more = len(raws) > limit
+            raws = raws[:limit]
+        cards = [_card_raw_to_response(raw) for raw in raws]
+        await _attach_includes(cards, include, db, owner)
+        return cards, str(offset + limit) if has_more else None
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+async def list_decks(
+    skip: int,
+    limit: int,
+    db: AsyncDatabase,
+    owner: User = None,
+    include: frozenset[str] = frozenset(),
+    cursor: str | None = None,
+    fields: frozenset[str] | None = None,
+) -> tuple[list[schemas.Deck], str | None]:
+    try:
+        raws, next_cursor = await _keyset_page(
+            _decks(db), {"owner": owner.id}, DECK_FIELDS, skip, limit, cursor
+        )
+        return await _decks_to_response(raws, db, owner, include, fields), next_cursor
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+async def list_deck_summaries(
+    skip: int,
+    limit: int,
+    db: AsyncDatabase,
+    owner: User = None,
+    cursor: str | None = None,
+) -> tuple[list[schemas.DeckSummary], str | None]:
+    """
+    One page of decks with ``card_count`` computed by $size in a single
+    aggregation, so no card documents are read. Pages the same way as
+    list_decks.
+    """
+    try:
+        match = {"owner": owner.id}
+        after = parse_cursor(cursor)
+        if after:
+            match["_id"] = {"$gt": after}
+        pipeline = [{"$match": match}, {"$sort": {"_id": 1}}]
+        if skip:
+            pipeline.append({"$skip": skip})
+        pipeline += [
+            {"$limit": limit + 1},
+            {
+                "$project": {
+                    "name": 1,
+                    "description": 1,
+                    "last_edited": 1,
+                    "card_count": {"$size": {"$ifNull": ["$cards", []]}},
+                }
+            },
+        ]
+        raws = await (await _decks(db).aggregate(pipeline)).to_list()
+        next_cursor = str(raws[limit - 1]["_id"]) if len(raws) > limit else None
+        return [_deck_summary_raw_to_response(raw) for raw in raws[:limit]], next_cursor
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+# ---- Search ----
+
+
+async def search_cards(
+    query: str,
+    cursor: str | None,
+    limit: int,
+    db: AsyncDatabase,
+    owner: User = None,
+    include: frozenset[str] = frozenset(),
+) -> tuple[list[schemas.Card], str | None]:
+    try:
+        pattern = {"$regex": re.escape(query), "$options": "i"}
+        filter_ = {
+            "owner": owner.id,
+            "$or": [
+                {field: pattern}
+                for field in (
+                    "front",
+                    "back",
+                    "example_original",
+                    "example_translation",
+                    "notes",
+                )
+            ],
+        }
+        raws, next_cursor = await _keyset_page(
+            _cards(db), filter_, CARD_FIELDS, 0, limit, cursor
+        )
+        cards = [_card_raw_to_response(raw) for raw in raws]
+        await _attach_includes(cards, include, db, owner)
+        return cards, next_cursor
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+# ---- Draft Review ----
+
+
+async def list_drafts(
+    book_id: str = None,
+    batch_id: str = None,
+    status: str = "pending",
+    skip: int = 0,
+    limit: int = 50,
+    db: AsyncDatabase = None,
+    owner: User = None,
+    include: frozenset[str] = frozenset(),
+    cursor: str | None = None,
+    fields: frozenset[str] | None = None,
+) -> tuple[list[schemas.DraftCardResponse], str | None]:
+    try:
+        filter_ = {"owner": owner.id}
+        if book_id:
+            filter_["book"] = ObjectId(book_id)
+        if batch_id:
+            filter_["generation_batch_id"] = batch_id
+        if status:
+            filter_["status"] = status
+        raws, next_cursor = await _keyset_page(
+            _drafts(db),
+            filter_,
+            select_fields(fields, DRAFT_RESPONSE_FIELDS, DRAFT_FIELDS),
+            skip,
+            limit,
+            cursor,
+        )
+        drafts = [_draft_raw_to_response(raw) for raw in raws]
+        await _attach_includes(drafts, include, db, owner, "book_id", "book")
+        return drafts, next_cursor
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
@@ -1,10 +1,11 @@
-import io
+import os
 import uuid
-from typing import List, Tuple, Optional
+from datetime import datetime, timedelta, timezone
 from . import schemas
 from .models import (
     Deck, Card, User, Book, BookProgress, DraftCard,
-    Chapter, PageRange, ExampleSentence, Template, TemplateField
+    Chapter, PageRange, ExampleSentence, Template, TemplateField,
+    Tombstone, SYNC_TOMBSTONE_RETENTION_DAYS, ReviewEvent,
 )
 from .utils.gemini import (
     generate_flashcards_from_pdf,
@@ -13,9 +14,15 @@ from .utils.gemini import (
     extract_page_range_as_pdf,
     get_pdf_page_count,
 )
-from mongoengine import Q
+from .utils.token import invalidate_user
+from .utils.cache import TTLCache
+from .utils.scheduler import schedule_review
+from .utils.review_log import review_log
+from mongoengine import Q, ValidationError
+from mongoengine.connection import get_db
 from bson import ObjectId
 from fastapi import HTTPException
+from pymongo import ReturnDocument, UpdateOne
 
 
 # ---- Serialization Helpers ----
@@ -24,6 +31,18 @@ def _example_to_schema(ex: ExampleSentence) -> schemas.ExampleSentenceSchema:
     return schemas.ExampleSentenceSchema(sentence=ex.sentence, translation=ex.translation)
 
 
+def _ref_id(doc, field: str) -> str | None:
+    """
+    Id of a reference field without dereferencing it. Documents loaded
+    from a query keep the stored DBRef/ObjectId in ``_data`` until the
+    attribute is first read; freshly built ones hold the Document itself.
+    """
+    value = doc._data.get(field)
+    if value is None:
+        return None
+    return str(getattr(value, "id", value))
+
+
 def _card_to_response(card_doc) -> schemas.Card:
     return schemas.Card(
         id=str(card_doc.id),
@@ -41,12 +60,13 @@ def _card_to_response(card_doc) -> schemas.Card:
         notes=card_doc.notes,
         tags=card_doc.tags or [],
         hardness_level=card_doc.hardness_level,
-        template_id=str(card_doc.template_id.id) if card_doc.template_id else None,
+        template_id=_ref_id(card_doc, "template_id"),
         custom_fields=card_doc.custom_fields or {},
         date_created=card_doc.date_created,
         last_edited=card_doc.last_edited,
         last_visited=card_doc.last_visited,
-        source_book_id=str(card_doc.source_book.id) if card_doc.source_book else None,
+        next_due=card_doc.next_due,
+        source_book_id=_ref_id(card_doc, "source_book"),
         source_page=card_doc.source_page,
     )
 
@@ -80,7 +100,7 @@ def _book_to_response(book_doc) -> schemas.BookResponse:
 def _progress_to_response(progress_doc) -> schemas.BookProgressResponse:
     return schemas.BookProgressResponse(
         id=str(progress_doc.id),
-        book_id=str(progress_doc.book.id),
+        book_id=_ref_id(progress_doc, "book"),
         current_page=progress_doc.current_page,
         current_chapter=progress_doc.current_chapter,
         pages_processed=[
@@ -107,10 +127,10 @@ def _draft_to_response(draft_doc) -> schemas.DraftCardResponse:
         pronunciation=draft_doc.pronunciation,
         notes=draft_doc.notes,
         tags=draft_doc.tags or [],
-        template_id=str(draft_doc.template_id.id) if draft_doc.template_id else None,
+        template_id=_ref_id(draft_doc, "template_id"),
         custom_fields=draft_doc.custom_fields or {},
         status=draft_doc.status,
-        book_id=str(draft_doc.book.id),
+        book_id=_ref_id(draft_doc, "book"),
         source_page_start=draft_doc.source_page_start,
         source_page_end=draft_doc.source_page_end,
         generation_batch_id=draft_doc.generation_batch_id,
@@ -118,6 +138,289 @@ def _draft_to_response(draft_doc) -> schemas.DraftCardResponse:
     )
 
 
+# Raw-document variants of the helpers above, for list endpoints that read
+# plain dicts (``as_pymongo()`` here, the async client in async_crud)
+# instead of building a Document per row. Values come straight from our
+# own collections, so the schemas are built with model_construct() and
+# skip field validation. References are bare ObjectIds and are never
+# dereferenced.
+
+# Fields loaded for each raw path, in mongoengine field names (``.only()``).
+CARD_FIELDS = (
+    "id", "front", "back", "example_original", "example_translation",
+    "examples", "synonyms", "antonyms", "part_of_speech", "gender",
+    "plural_form", "pronunciation", "notes", "tags", "hardness_level",
+    "template_id", "custom_fields", "date_created", "last_edited",
+    "last_visited", "next_due", "source_book", "source_page",
+)
+DECK_FIELDS = ("id", "name", "description", "cards")
+DRAFT_FIELDS = (
+    "id", "front", "back", "examples", "synonyms", "antonyms",
+    "part_of_speech", "gender", "plural_form", "pronunciation", "notes",
+    "tags", "template_id", "custom_fields", "status", "book",
+    "source_page_start", "source_page_end", "generation_batch_id",
+    "date_created",
+)
+BOOK_FIELDS = (
+    "id", "title", "filename", "total_pages", "chapters", "target_language",
+    "native_language", "date_created", "last_edited",
+)
+
+
+def projection(fields: tuple[str, ...]) -> dict:
+    """Translates a field tuple above into a pymongo projection."""
+    return {"_id" if f == "id" else f: 1 for f in fields}
+
+
+def _examples_raw_to_schema(examples) -> list[schemas.ExampleSentenceSchema]:
+    return [
+        schemas.ExampleSentenceSchema.model_construct(
+            sentence=ex.get("sentence"), translation=ex.get("translation")
+        )
+        for ex in examples or []
+    ]
+
+
+def _card_raw_to_response(raw: dict) -> schemas.Card:
+    return schemas.Card.model_construct(
+        id=str(raw["_id"]),
+        front=raw.get("front"),
+        back=raw.get("back"),
+        example_original=raw.get("example_original"),
+        example_translation=raw.get("example_translation"),
+        examples=_examples_raw_to_schema(raw.get("examples")),
+        synonyms=raw.get("synonyms") or [],
+        antonyms=raw.get("antonyms") or [],
+        part_of_speech=raw.get("part_of_speech"),
+        gender=raw.get("gender"),
+        plural_form=raw.get("plural_form"),
+        pronunciation=raw.get("pronunciation"),
+        notes=raw.get("notes"),
+        tags=raw.get("tags") or [],
+        hardness_level=schemas.HardnessLevel(raw.get("hardness_level") or "medium"),
+        template_id=str(raw["template_id"]) if raw.get("template_id") else None,
+        custom_fields=raw.get("custom_fields") or {},
+        date_created=raw.get("date_created"),
+        last_edited=raw.get("last_edited"),
+        last_visited=raw.get("last_visited"),
+        next_due=raw.get("next_due"),
+        source_book_id=str(raw["source_book"]) if raw.get("source_book") else None,
+        source_page=raw.get("source_page"),
+    )
+
+
+def _deck_summary_raw_to_response(raw: dict) -> schemas.DeckSummary:
+    return schemas.DeckSummary.model_construct(
+        id=str(raw["_id"]),
+        name=raw.get("name"),
+        description=raw.get("description"),
+        card_count=raw.get("card_count", 0),
+        last_edited=raw.get("last_edited"),
+    )
+
+
+def _deck_raw_to_response(raw: dict, cards_by_id: dict) -> schemas.Deck:
+    """Builds a deck from its raw document and the already-loaded cards."""
+    return schemas.Deck.model_construct(
+        id=str(raw["_id"]),
+        name=raw.get("name"),
+        description=raw.get("description"),
+        cards=[
+            cards_by_id[card_id]
+            for card_id in raw.get("cards") or []
+            if card_id in cards_by_id
+        ],
+    )
+
+
+def _draft_raw_to_response(raw: dict) -> schemas.DraftCardResponse:
+    return schemas.DraftCardResponse.model_construct(
+        id=str(raw["_id"]),
+        front=raw.get("front"),
+        back=raw.get("back"),
+        examples=_examples_raw_to_schema(raw.get("examples")),
+        synonyms=raw.get("synonyms") or [],
+        antonyms=raw.get("antonyms") or [],
+        part_of_speech=raw.get("part_of_speech"),
+        gender=raw.get("gender"),
+        plural_form=raw.get("plural_form"),
+        pronunciation=raw.get("pronunciation"),
+        notes=raw.get("notes"),
+        tags=raw.get("tags") or [],
+        template_id=str(raw["template_id"]) if raw.get("template_id") else None,
+        custom_fields=raw.get("custom_fields") or {},
+        status=schemas.DraftCardStatus(raw.get("status") or "pending"),
+        book_id=str(raw["book"]) if raw.get("book") else None,
+        source_page_start=raw.get("source_page_start"),
+        source_page_end=raw.get("source_page_end"),
+        generation_batch_id=raw.get("generation_batch_id"),
+        date_created=raw.get("date_created"),
+    )
+
+
+def _book_raw_to_response(raw: dict) -> schemas.BookResponse:
+    return schemas.BookResponse.model_construct(
+        id=str(raw["_id"]),
+        title=raw.get("title"),
+        filename=raw.get("filename"),
+        total_pages=raw.get("total_pages"),
+        chapters=[
+            schemas.ChapterSchema.model_construct(
+                name=ch.get("name"), start_page=ch.get("start_page"), end_page=ch.get("end_page")
+            )
+            for ch in raw.get("chapters") or []
+        ],
+        target_language=raw.get("target_language"),
+        native_language=raw.get("native_language"),
+        date_created=raw.get("date_created"),
+        last_edited=raw.get("last_edited"),
+    )
+
+
+def _template_raw_to_response(raw: dict) -> schemas.TemplateResponse:
+    return schemas.TemplateResponse.model_construct(
+        id=str(raw["_id"]),
+        name=raw.get("name"),
+        description=raw.get("description"),
+        fields=[
+            schemas.TemplateFieldSchema.model_construct(
+                name=f.get("name"),
+                label=f.get("label"),
+                type=f.get("type", "text"),
+                description=f.get("description"),
+                show_on_front=f.get("show_on_front", False),
+                required=f.get("required", True),
+            )
+            for f in raw.get("fields") or []
+        ],
+        system_prompt=raw.get("system_prompt"),
+        is_default=raw.get("is_default", False),
+        date_created=raw.get("date_created"),
+        last_edited=raw.get("last_edited"),
+        owner_id=str(raw["owner"]) if raw.get("owner") else None,
+    )
+
+
+# Referenced documents that list/get endpoints can embed on request.
+INCLUDE_OPTIONS = ("template", "book")
+
+
+def parse_include(include: str | None) -> frozenset[str]:
+    """
+    Parses an ``?include=template,book`` query value. Unknown names are
+    rejected so typos don't silently return bare ids.
+    """
+    if not include:
+        return frozenset()
+    names = frozenset(name.strip() for name in include.split(",") if name.strip())
+    unknown = names.difference(INCLUDE_OPTIONS)
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown include: {', '.join(sorted(unknown))}. "
+                   f"Allowed: {', '.join(INCLUDE_OPTIONS)}",
+        )
+    return names
+
+
+# Sparse fieldsets: ``?fields=front,back`` limits card/draft responses to
+# the named response fields, loading only those from Mongo. "id" is always
+# returned. These map response field names to the model fields to load.
+CARD_RESPONSE_FIELDS = {
+    ("source_book_id" if field == "source_book" else field): field for field in CARD_FIELDS
+}
+DRAFT_RESPONSE_FIELDS = {
+    ("book_id" if field == "book" else field): field for field in DRAFT_FIELDS
+}
+# Response fields that ?include= needs: the reference id and the embed.
+CARD_INCLUDE_FIELDS = {
+    "template": ("template_id", "template"),
+    "book": ("source_book_id", "source_book"),
+}
+DRAFT_INCLUDE_FIELDS = {
+    "template": ("template_id", "template"),
+    "book": ("book_id", "book"),
+}
+
+
+def parse_fields(
+    fields: str | None,
+    available: dict[str, str],
+    include: frozenset[str] = frozenset(),
+    include_fields: dict[str, tuple[str, ...]] | None = None,
+) -> frozenset[str] | None:
+    """
+    Parses a ``?fields=`` value into the set of response fields to return,
+    or None for the full response. Unknown names are rejected with 400.
+    """
+    if not fields:
+        return None
+    selected = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = selected.difference(available)
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}",
+        )
+    selected.add("id")
+    for name in include:
+        selected.update(include_fields[name])
+    return frozenset(selected)
+
+
+def select_fields(
+    selected: frozenset[str] | None, available: dict[str, str], default: tuple[str, ...]
+) -> tuple[str, ...]:
+    """The model fields to load for a parsed fieldset."""
+    if selected is None:
+        return default
+    return tuple(available[name] for name in selected if name in available)
+
+
+def deck_fields_include(selected: frozenset[str] | None) -> dict | None:
+    """pydantic ``include`` for a deck whose cards use a sparse fieldset."""
+    if selected is None:
+        return None
+    return {"id": True, "name": True, "description": True, "cards": {"__all__": set(selected)}}
+
+
+# List endpoints page either with skip/limit or with a keyset cursor: the
+# id of the last item of the previous page. Both modes sort by _id, which
+# the (owner, _id) indexes serve, so deep pages cost the same as the first.
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+# Upper bound for ``limit`` on paged endpoints.
+MAX_PAGE_SIZE = 200
+
+
+def parse_cursor(cursor: str | None) -> ObjectId | None:
+    if not cursor:
+        return None
+    try:
+        return ObjectId(cursor)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def parse_offset_cursor(cursor: str | None) -> int:
+    """
+    Cursor for pages that aren't ordered by _id (e.g. a deck's cards in
+    deck order): the number of items already returned.
+    """
+    if not cursor:
+        return 0
+    try:
+        offset = int(cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if offset < 0:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return offset
+
+
+def next_cursor_headers(next_cursor: str | None) -> dict:
+    return {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else {}
+
+
 def _examples_to_embedded(examples_data):
     """Convert a list of ExampleSentenceSchema to ExampleSentence embedded docs."""
     if not examples_data:
@@ -128,6 +431,79 @@ def _examples_to_embedded(examples_data):
     ]
 
 
+# ---- Bulk Persistence ----
+
+def _collection(model, db: str = "default"):
+    """
+    The pymongo collection of ``model`` on the ``db`` alias. Looked up on
+    the connection rather than with switch_db, which swaps the alias on
+    the class itself and so would redirect concurrent requests' queries.
+    """
+    return get_db(db)[model._get_collection_name()]
+
+
+def bulk_insert(documents: list, db: str = "default", validate: bool = True) -> list:
+    """
+    Inserts new documents of a single Document class with one unordered
+    insert_many instead of a save() per document. Each document is
+    validated (running its clean()) first, unless the caller already did,
+    and the generated ids are set back on the objects so they serialize
+    like saved documents.
+
+    Unlike save(), no signals fire and nothing is written if any
+    document fails validation.
+    """
+    if not documents:
+        return documents
+    if validate:
+        for doc in documents:
+            doc.validate()
+    payload = [doc.to_mongo() for doc in documents]
+    result = _collection(type(documents[0]), db).insert_many(payload, ordered=False)
+    for doc, inserted_id in zip(documents, result.inserted_ids):
+        doc.pk = inserted_id
+        doc._clear_changed_fields()
+        doc._created = False
+    return documents
+
+
+def _set_fields(model, values: dict) -> dict:
+    """
+    Validates attribute values for ``model`` and converts them into a
+    ``$set`` document, raising ValidationError like save() would.
+    """
+    update = {}
+    for field, value in values.items():
+        field_def = model._fields[field]
+        field_def.validate(value)
+        update[field_def.db_field] = field_def.to_mongo(value)
+    return update
+
+
+def _update_owned(
+    model, doc_id: str, values: dict, fields: tuple[str, ...],
+    db: str = "default", owner: User = None, touch: bool = True,
+) -> dict | None:
+    """
+    Applies ``values`` to one of the owner's documents with a single
+    find_one_and_update and returns the raw post-image (only ``fields``),
+    or None if the document doesn't exist. Only the changed fields are
+    written, so concurrent edits to other fields aren't clobbered.
+    ``touch`` also bumps last_edited.
+    """
+    update = _set_fields(model, values)
+    if touch:
+        update["last_edited"] = datetime.utcnow()
+    query = {"_id": ObjectId(doc_id), "owner": owner.id}
+    collection = _collection(model, db)
+    if not update:
+        return collection.find_one(query, projection(fields))
+    return collection.find_one_and_update(
+        query, {"$set": update},
+        projection=projection(fields), return_document=ReturnDocument.AFTER,
+    )
+
+
 # ---- User CRUD ----
 
 def get_user_by_username(username: str, db: str = "default") -> User | None:
@@ -145,11 +521,16 @@ def get_user_by_email(email: str, db: str = "default") -> User | None:
 
 
 def create_user(
-    user_create: schemas.UserCreate, db: str = "default"
+    user_create: schemas.UserCreate,
+    db: str = "default",
+    hashed_password: str | None = None,
 ) -> schemas.UserOut:
     try:
         user = User(username=user_create.username, email=user_create.email)
-        user.set_password(user_create.password)
+        if hashed_password is None:
+            user.set_password(user_create.password)
+        else:
+            user.hashed_password = hashed_password
         user.save(using=db)
         return schemas.UserOut(
             id=str(user.id),
@@ -161,17 +542,6 @@ def create_user(
         raise HTTPException(status_code=500, detail=str(e))
 
 
-def authenticate_user(
-    username: str, password: str, db: str = "default"
-) -> User | None:
-    user = get_user_by_username(username, db)
-    if not user:
-        return None
-    if not user.check_password(password):
-        return None
-    return user
-
-
 # ---- Template CRUD ----
 
 def _template_to_response(template_doc: Template) -> schemas.TemplateResponse:
@@ -193,7 +563,7 @@ def _template_to_response(template_doc: Template) -> schemas.TemplateResponse:
         is_default=template_doc.is_default,
         date_created=template_doc.date_created,
         last_edited=template_doc.last_edited,
-        owner=str(template_doc.owner.id) if template_doc.owner else None
+        owner=_ref_id(template_doc, "owner")
     )
 
 def create_template(template: schemas.TemplateCreate, db: str = "default", owner: User = None) -> schemas.TemplateResponse:
@@ -260,8 +630,8 @@ def list_templates(skip: int = 0, limit: int = 50, include_defaults: bool = True
         query = Q(owner=owner) | Q(is_default=True)
     else:
         query = Q(owner=owner)
-    templates = Template.objects.filter(query).skip(skip).limit(limit)
-    return [_template_to_response(t) for t in templates]
+    templates = Template.objects.filter(query).skip(skip).limit(limit).as_pymongo()
+    return [_template_raw_to_response(t) for t in templates]
 
 
 def seed_default_templates():
@@ -361,144 +731,563 @@ def update_deck(
 
 def delete_deck(deck_id: str, db: str = "default", owner: User = None) -> bool:
     try:
-        deck_doc = Deck.objects.using(db).get(id=ObjectId(deck_id), owner=owner)
-        deck_doc.delete(using=db)
+        deck_oid = ObjectId(deck_id)
+        if not Deck.objects(id=deck_oid, owner=owner).using(db).delete():
+            return False
+        _record_deletions("deck", [deck_oid], db, owner)
         return True
-    except Deck.DoesNotExist:
-        return False
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-def list_decks(
-    skip: int, limit: int, db: str = "default", owner: User = None
-) -> list[schemas.Deck]:
-    try:
-        deck_docs = Deck.objects(owner=owner).using(db).skip(skip).limit(limit)
-        return [_deck_to_response(deck) for deck in deck_docs]
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+# ---- Card CRUD ----
 
+# Per-user aggregates over the card collection, cached so dashboards don't
+# rerun them on every load. The caches are filled from the primary, so
+# after a card write (every write path calls _cards_changed()) the same
+# worker serves read-your-writes results. The caches are per process:
+# other workers keep their copy until it expires, so across workers the
+# aggregates can be up to CARD_STATS_CACHE_TTL_SECONDS stale.
+CARD_STATS_CACHE_TTL_SECONDS = float(os.getenv("CARD_STATS_CACHE_TTL_SECONDS", "300"))
+CARD_STATS_CACHE_MAX_ENTRIES = int(os.getenv("CARD_STATS_CACHE_MAX_ENTRIES", "10000"))
+CARD_STATS_TOP_TAGS = int(os.getenv("CARD_STATS_TOP_TAGS", "20"))
+CARD_STATS_RECENT = int(os.getenv("CARD_STATS_RECENT", "5"))
+
+_card_stats_cache = TTLCache(
+    maxsize=CARD_STATS_CACHE_MAX_ENTRIES, ttl=CARD_STATS_CACHE_TTL_SECONDS
+)
+_card_tags_cache = TTLCache(
+    maxsize=CARD_STATS_CACHE_MAX_ENTRIES, ttl=CARD_STATS_CACHE_TTL_SECONDS
+)
+
+
+def _cards_changed(owner: User) -> None:
+    """Drops the owner's cached card aggregates after a card write."""
+    _card_stats_cache.pop(owner.id)
+    _card_tags_cache.pop(owner.id)
+
+
+def _card_from_create(card: schemas.CardCreate, owner: User) -> Card:
+    return Card(
+        front=card.front,
+        back=card.back,
+        example_original=card.example_original,
+        example_translation=card.example_translation,
+        examples=_examples_to_embedded(card.examples),
+        synonyms=card.synonyms or [],
+        antonyms=card.antonyms or [],
+        part_of_speech=card.part_of_speech,
+        gender=card.gender,
+        plural_form=card.plural_form,
+        pronunciation=card.pronunciation,
+        notes=card.notes,
+        tags=card.tags or [],
+        hardness_level=card.hardness_level,
+        owner=owner,
+    )
+
+
+def _card_update_values(card_update: schemas.CardUpdate) -> dict:
+    """The Card attributes a CardUpdate changes; None fields are left alone."""
+    values = {}
+    for field in [
+        "front", "back", "example_original", "example_translation",
+        "part_of_speech", "gender", "plural_form", "pronunciation",
+        "notes", "hardness_level", "synonyms", "antonyms", "tags",
+    ]:
+        value = getattr(card_update, field, None)
+        if value is not None:
+            values[field] = value
+    if card_update.examples is not None:
+        values["examples"] = _examples_to_embedded(card_update.examples)
+    return values
 
-# ---- Card CRUD ----
 
 def create_card(
     card: schemas.CardCreate, db: str = "default", owner: User = None
 ) -> schemas.Card:
     try:
-        card_doc = Card(
-            front=card.front,
-            back=card.back,
-            example_original=card.example_original,
-            example_translation=card.example_translation,
-            examples=_examples_to_embedded(card.examples),
-            synonyms=card.synonyms or [],
-            antonyms=card.antonyms or [],
-            part_of_speech=card.part_of_speech,
-            gender=card.gender,
-            plural_form=card.plural_form,
-            pronunciation=card.pronunciation,
-            notes=card.notes,
-            tags=card.tags or [],
-            hardness_level=card.hardness_level,
-            owner=owner,
-        )
+        card_doc = _card_from_create(card, owner)
         card_doc.save(using=db)
+        _cards_changed(owner)
         return _card_to_response(card_doc)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-def get_card(
-    card_id: str, db: str = "default", owner: User = None
-) -> schemas.Card | None:
-    try:
-        card_doc = Card.objects.using(db).get(id=ObjectId(card_id), owner=owner)
-        return _card_to_response(card_doc)
-    except Card.DoesNotExist:
-        return None
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
-
-
 def update_card(
     card_id: str,
     card_update: schemas.CardUpdate,
     db: str = "default",
     owner: User = None,
 ) -> schemas.Card | None:
+    """
+    Applies a partial update. ``hardness_level`` is stored as a plain
+    field edit, as in bulk_update_cards; reviews that should advance the
+    schedule go through apply_card_reviews.
+    """
     try:
-        card_doc = Card.objects.using(db).get(id=ObjectId(card_id), owner=owner)
-        for field in [
-            "front", "back", "example_original", "example_translation",
-            "part_of_speech", "gender", "plural_form", "pronunciation",
-            "notes", "hardness_level",
-        ]:
-            value = getattr(card_update, field, None)
-            if value is not None:
-                setattr(card_doc, field, value)
-        if card_update.examples is not None:
-            card_doc.examples = _examples_to_embedded(card_update.examples)
-        if card_update.synonyms is not None:
-            card_doc.synonyms = card_update.synonyms
-        if card_update.antonyms is not None:
-            card_doc.antonyms = card_update.antonyms
-        if card_update.tags is not None:
-            card_doc.tags = card_update.tags
-        card_doc.save(using=db)
-        return get_card(card_id, db, owner)
-    except Card.DoesNotExist:
-        return None
+        raw = _update_owned(
+            Card, card_id, _card_update_values(card_update), CARD_FIELDS, db, owner
+        )
+        _cards_changed(owner)
+        return _card_raw_to_response(raw) if raw else None
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 def delete_card(card_id: str, db: str = "default", owner: User = None) -> bool:
     try:
-        card_doc = Card.objects.using(db).get(id=ObjectId(card_id), owner=owner)
-        card_doc.delete(using=db)
-        return True
-    except Card.DoesNotExist:
-        return False
+        # A queryset delete applies the same reverse-delete rules as
+        # Document.delete() without loading the card first.
+        existing = _existing_card_ids({ObjectId(card_id)}, db, owner)
+        _delete_cards(existing, db, owner)
+        return bool(existing)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-def list_cards(
-    skip: int, limit: int, db: str = "default", owner: User = None
-) -> list[schemas.Card]:
+def _delete_cards(card_ids: set[ObjectId], db: str = "default", owner: User = None) -> None:
+    """
+    Deletes the owner's cards with one queryset delete, which applies the
+    model's reverse-delete rules: decks containing a deleted card are
+    deleted too (CASCADE). Tombstones are recorded for both so sync
+    clients learn about the deletions.
+    """
+    if not card_ids:
+        return
+    card_ids = list(card_ids)
+    deck_ids = Deck.objects(owner=owner, cards__in=card_ids).using(db).distinct("id")
+    Card.objects(id__in=card_ids, owner=owner).using(db).delete()
+    _record_deletions("card", card_ids, db, owner)
+    _record_deletions("deck", deck_ids, db, owner)
+    _cards_changed(owner)
+
+
+# ---- Bulk Card Operations ----
+
+def _bulk_result(
+    index: int, status: schemas.BulkItemStatus, id: str | None = None,
+    error: str | None = None, card: schemas.Card | None = None,
+) -> schemas.CardBulkItemResult:
+    return schemas.CardBulkItemResult(
+        index=index, id=id, status=status, error=error, card=card
+    )
+
+
+def _bulk_response(results: list[schemas.CardBulkItemResult]) -> schemas.CardBulkResponse:
+    failed = sum(
+        r.status in (schemas.BulkItemStatus.NOT_FOUND, schemas.BulkItemStatus.INVALID)
+        for r in results
+    )
+    return schemas.CardBulkResponse(
+        succeeded=len(results) - failed, failed=failed, results=results
+    )
+
+
+def _parse_bulk_ids(ids: list[str], results: list) -> dict[int, ObjectId]:
+    """Maps item index to ObjectId, recording malformed ids as invalid."""
+    parsed = {}
+    for index, card_id in enumerate(ids):
+        try:
+            parsed[index] = ObjectId(card_id)
+        except Exception:
+            results[index] = _bulk_result(
+                index, schemas.BulkItemStatus.INVALID, card_id, "Invalid card id"
+            )
+    return parsed
+
+
+def _existing_card_ids(ids, db: str, owner: User) -> set[ObjectId]:
+    if not ids:
+        return set()
+    return set(Card.objects(id__in=list(ids), owner=owner).using(db).distinct("id"))
+
+
+def bulk_create_cards(
+    cards: list[schemas.CardCreate], db: str = "default", owner: User = None
+) -> schemas.CardBulkResponse:
+    """
+    Creates many cards with one insert_many. Cards that fail validation
+    are reported as invalid and the rest are still created.
+    """
+    try:
+        results = [None] * len(cards)
+        docs, indexes = [], []
+        for index, card in enumerate(cards):
+            card_doc = _card_from_create(card, owner)
+            try:
+                card_doc.validate()
+            except ValidationError as e:
+                results[index] = _bulk_result(index, schemas.BulkItemStatus.INVALID, error=str(e))
+                continue
+            docs.append(card_doc)
+            indexes.append(index)
+        bulk_insert(docs, db, validate=False)
+        _cards_changed(owner)
+        for index, card_doc in zip(indexes, docs):
+            results[index] = _bulk_result(
+                index, schemas.BulkItemStatus.CREATED, str(card_doc.id),
+                card=_card_to_response(card_doc),
+            )
+        return _bulk_response(results)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+def bulk_update_cards(
+    items: list[schemas.CardBulkUpdateItem], db: str = "default", owner: User = None
+) -> schemas.CardBulkResponse:
+    """
+    Applies partial updates to many cards: one query to find which ids
+    the caller owns, one ordered bulk_write of $set updates (so repeated
+    ids apply in request order) and one query to return the results.
+    As in update_card, ``hardness_level`` is a plain edit and doesn't
+    reschedule the card.
+    """
     try:
-        card_docs = Card.objects(owner=owner).using(db).skip(skip).limit(limit)
-        return [_card_to_response(card) for card in card_docs]
+        results = [None] * len(items)
+        oids = _parse_bulk_ids([item.id for item in items], results)
+        updates = {}
+        for index, oid in oids.items():
+            try:
+                update = _set_fields(Card, _card_update_values(items[index]))
+            except ValidationError as e:
+                results[index] = _bulk_result(
+                    index, schemas.BulkItemStatus.INVALID, items[index].id, str(e)
+                )
+                continue
+            update["last_edited"] = datetime.utcnow()
+            updates[index] = update
+
+        existing = _existing_card_ids({oids[index] for index in updates}, db, owner)
+        operations = [
+            UpdateOne({"_id": oids[index], "owner": owner.id}, {"$set": update})
+            for index, update in updates.items()
+            if oids[index] in existing
+        ]
+        if operations:
+            _collection(Card, db).bulk_write(operations, ordered=True)
+            _cards_changed(owner)
+
+        cards_by_id = {}
+        if existing:
+            for raw in (
+                Card.objects(id__in=list(existing), owner=owner).using(db)
+                .only(*CARD_FIELDS).as_pymongo()
+            ):
+                cards_by_id[raw["_id"]] = _card_raw_to_response(raw)
+        for index in updates:
+            oid = oids[index]
+            if oid in existing:
+                results[index] = _bulk_result(
+                    index, schemas.BulkItemStatus.UPDATED, str(oid), card=cards_by_id.get(oid)
+                )
+            else:
+                results[index] = _bulk_result(
+                    index, schemas.BulkItemStatus.NOT_FOUND, str(oid), "Card not found"
+                )
+        return _bulk_response(results)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-# ---- Search ----
+def _naive_utc(moment: datetime) -> datetime:
+    """Mongo stores naive UTC datetimes; normalise client timestamps to match."""
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc).replace(tzinfo=None)
+    return moment
 
-def search_cards(
-    query: str,
-    cursor: str | None,
-    limit: int,
-    db: str = "default",
-    owner: User = None,
-) -> tuple[list[schemas.Card], str | None]:
+
+def apply_card_reviews(
+    reviews: list[schemas.CardReviewUpdate], db: str = "default", owner: User = None
+) -> schemas.CardBulkResponse:
+    """
+    Applies queued hardness/last_visited updates with last-writer-wins on
+    ``client_ts``: one query prefetches the stored review timestamps and
+    scheduling state, and one unordered bulk_write applies the winners.
+    Each update is filtered on the stored timestamp as well, so a newer
+    review written concurrently is never overwritten. A hardness rating
+    also advances the card's spaced-repetition schedule.
+
+    Every review of an existing card, stale ones included, is appended to
+    the review event log. A retried drain can log a review twice;
+    analyses should dedupe on (card_id, ts).
+    """
     try:
-        q = (
-            Q(front__icontains=query)
-            | Q(back__icontains=query)
-            | Q(example_original__icontains=query)
-            | Q(example_translation__icontains=query)
-            | Q(notes__icontains=query)
-        ) & Q(owner=owner)
-        if cursor:
-            q &= Q(id__gt=ObjectId(cursor))
-        card_docs = Card.objects(q).order_by("id").using(db).limit(limit + 1)
-        results = card_docs[:limit]
-        next_cursor = str(card_docs[-1].id) if len(card_docs) > limit else None
-        return (
-            [_card_to_response(card) for card in results],
-            next_cursor,
+        results = [None] * len(reviews)
+        oids = _parse_bulk_ids([review.card_id for review in reviews], results)
+        winners = {}
+        for index, oid in oids.items():
+            review = reviews[index]
+            if review.hardness_level is None and review.last_visited is None:
+                results[index] = _bulk_result(
+                    index, schemas.BulkItemStatus.INVALID, review.card_id,
+                    "hardness_level or last_visited is required",
+                )
+                continue
+            client_ts = _naive_utc(review.client_ts)
+            best = winners.get(oid)
+            if best is None or client_ts >= best[1]:
+                winners[oid] = (index, client_ts)
+
+        stored = {}
+        if winners:
+            for raw in (
+                Card.objects(id__in=list(winners), owner=owner).using(db)
+                .only("id", "review_client_ts", "interval_days", "ease").as_pymongo()
+            ):
+                stored[raw["_id"]] = raw
+
+        now = datetime.utcnow()
+        operations, applied = [], set()
+        for oid, (index, client_ts) in winners.items():
+            if oid not in stored:
+                continue
+            stored_ts = stored[oid].get("review_client_ts")
+            if stored_ts is not None and stored_ts >= client_ts:
+                continue
+            review = reviews[index]
+            values = {"review_client_ts": client_ts, "last_edited": now}
+            reviewed_at = client_ts
+            if review.last_visited is not None:
+                reviewed_at = values["last_visited"] = _naive_utc(review.last_visited)
+            if review.hardness_level is not None:
+                values["hardness_level"] = review.hardness_level.value
+                values.update(schedule_review(
+                    review.hardness_level, reviewed_at,
+                    stored[oid].get("interval_days"), stored[oid].get("ease"),
+                ))
+            operations.append(UpdateOne(
+                {
+                    "_id": oid,
+                    "owner": owner.id,
+                    "$or": [
+                        {"review_client_ts": None},
+                        {"review_client_ts": {"$lt": client_ts}},
+                    ],
+                },
+                {"$set": values},
+            ))
+            applied.add(index)
+        if operations:
+            _collection(Card, db).bulk_write(operations, ordered=False)
+            _cards_changed(owner)
+
+        events = []
+        for index, oid in oids.items():
+            if results[index] is not None:
+                continue
+            if oid not in stored:
+                results[index] = _bulk_result(
+                    index, schemas.BulkItemStatus.NOT_FOUND, str(oid), "Card not found"
+                )
+                continue
+            review = reviews[index]
+            events.append(ReviewEvent(
+                owner=owner,
+                card_id=oid,
+                hardness_level=review.hardness_level,
+                ts=_naive_utc(review.last_visited or review.client_ts),
+            ))
+            if index in applied:
+                results[index] = _bulk_result(index, schemas.BulkItemStatus.UPDATED, str(oid))
+            else:
+                results[index] = _bulk_result(index, schemas.BulkItemStatus.STALE, str(oid))
+        review_log.add(events)
+        return _bulk_response(results)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+def bulk_delete_cards(
+    ids: list[str], db: str = "default", owner: User = None
+) -> schemas.CardBulkResponse:
+    """
+    Deletes many cards with one query, applying the same reverse-delete
+    rules as delete_card.
+    """
+    try:
+        results = [None] * len(ids)
+        oids = _parse_bulk_ids(ids, results)
+        existing = _existing_card_ids(set(oids.values()), db, owner)
+        _delete_cards(existing, db, owner)
+        for index, oid in oids.items():
+            if oid in existing:
+                results[index] = _bulk_result(index, schemas.BulkItemStatus.DELETED, str(oid))
+            else:
+                results[index] = _bulk_result(
+                    index, schemas.BulkItemStatus.NOT_FOUND, str(oid), "Card not found"
+                )
+        return _bulk_response(results)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+def card_stats(db: str = "default", owner: User = None) -> schemas.CardStats:
+    """
+    Counts per hardness level, top tags, per-book counts and the most
+    recently edited cards, computed with one $facet aggregation.
+    """
+    stats = _card_stats_cache.get(owner.id)
+    if stats is not None:
+        return stats
+    try:
+        pipeline = [
+            {"$match": {"owner": owner.id}},
+            {"$facet": {
+                "total": [{"$count": "count"}],
+                "by_hardness": [
+                    {"$group": {"_id": "$hardness_level", "count": {"$sum": 1}}},
+                ],
+                "top_tags": [
+                    {"$unwind": "$tags"},
+                    {"$group": {"_id": "$tags", "count": {"$sum": 1}}},
+                    {"$sort": {"count": -1, "_id": 1}},
+                    {"$limit": CARD_STATS_TOP_TAGS},
+                ],
+                "by_book": [
+                    {"$match": {"source_book": {"$ne": None}}},
+                    {"$group": {"_id": "$source_book", "count": {"$sum": 1}}},
+                    {"$sort": {"count": -1, "_id": 1}},
+                ],
+                "recently_edited": [
+                    {"$sort": {"last_edited": -1}},
+                    {"$limit": CARD_STATS_RECENT},
+                    {"$project": projection(CARD_FIELDS)},
+                ],
+            }},
+        ]
+        facets = next(_collection(Card, db).aggregate(pipeline))
+        by_hardness = {level: 0 for level in schemas.HardnessLevel}
+        for row in facets["by_hardness"]:
+            by_hardness[schemas.HardnessLevel(row["_id"] or "medium")] += row["count"]
+        stats = schemas.CardStats.model_construct(
+            total=facets["total"][0]["count"] if facets["total"] else 0,
+            by_hardness=by_hardness,
+            top_tags=[
+                schemas.TagCount.model_construct(tag=row["_id"], count=row["count"])
+                for row in facets["top_tags"]
+            ],
+            by_book=[
+                schemas.BookCardCount.model_construct(book_id=str(row["_id"]), count=row["count"])
+                for row in facets["by_book"]
+            ],
+            recently_edited=[_card_raw_to_response(raw) for raw in facets["recently_edited"]],
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    _card_stats_cache.set(owner.id, stats)
+    return stats
+
+
+def card_tags(
+    prefix: str | None = None, limit: int | None = None,
+    db: str = "default", owner: User = None,
+) -> list[schemas.TagCount]:
+    """
+    The owner's tag catalog with card counts, most used first. The full
+    catalog is aggregated from the (owner, tags) index and cached; prefix
+    filtering and the limit are applied to the cached list.
+    """
+    tags = _card_tags_cache.get(owner.id)
+    if tags is None:
+        try:
+            pipeline = [
+                {"$match": {"owner": owner.id, "tags": {"$exists": True, "$ne": []}}},
+                {"$project": {"_id": 0, "tags": 1}},
+                {"$unwind": "$tags"},
+                {"$group": {"_id": "$tags", "count": {"$sum": 1}}},
+                {"$sort": {"count": -1, "_id": 1}},
+            ]
+            tags = [
+                schemas.TagCount.model_construct(tag=row["_id"], count=row["count"])
+                for row in _collection(Card, db).aggregate(pipeline)
+            ]
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
+        _card_tags_cache.set(owner.id, tags)
+    if prefix:
+        needle = prefix.casefold()
+        tags = [t for t in tags if t.tag.casefold().startswith(needle)]
+    return tags[:limit] if limit else tags
+
+
+# ---- Delta Sync ----
+
+# Sync tokens are millisecond timestamps. last_edited is stamped by the
+# app servers' clocks, so each token is backdated by this margin; the
+# overlap may resend a few changes, which clients apply idempotently.
+SYNC_CLOCK_SKEW_SECONDS = float(os.getenv("SYNC_CLOCK_SKEW_SECONDS", "5"))
+SYNC_DECK_FIELDS = ("id", "name", "description", "cards", "last_edited")
+
+
+def _record_deletions(kind: str, ids, db: str = "default", owner: User = None) -> None:
+    if ids:
+        bulk_insert(
+            [Tombstone(owner=owner, kind=kind, object_id=oid) for oid in ids],
+            db, validate=False,
+        )
+
+
+def _sync_token(moment: datetime) -> str:
+    return str(int(moment.replace(tzinfo=timezone.utc).timestamp() * 1000))
+
+
+def _parse_sync_token(token: str) -> datetime:
+    try:
+        return datetime.fromtimestamp(int(token) / 1000, tz=timezone.utc).replace(tzinfo=None)
+    except (ValueError, OverflowError, OSError):
+        raise HTTPException(status_code=400, detail="Invalid sync token")
+
+
+def sync_changes(
+    since: str | None = None, db: str = "default", owner: User = None
+) -> schemas.SyncChanges:
+    """
+    Cards, decks and deletions changed since a token from a previous call,
+    found through the (owner, last_edited) and (owner, deleted_at)
+    indexes, plus the token for the next call. Without a token, or with
+    one older than the tombstone retention, a full snapshot is returned
+    with ``reset`` set.
+    """
+    since_at = _parse_sync_token(since) if since else None
+    now = datetime.utcnow()
+    token = _sync_token(now - timedelta(seconds=SYNC_CLOCK_SKEW_SECONDS))
+    reset = since_at is None or since_at < now - timedelta(days=SYNC_TOMBSTONE_RETENTION_DAYS)
+    try:
+        changed = {} if reset else {"last_edited__gte": since_at}
+        card_raws = (
+            Card.objects(owner=owner, **changed).using(db)
+            .only(*CARD_FIELDS).as_pymongo()
+        )
+        deck_raws = (
+            Deck.objects(owner=owner, **changed).using(db)
+            .only(*SYNC_DECK_FIELDS).as_pymongo()
+        )
+        deleted = {"card": [], "deck": []}
+        if not reset:
+            for raw in (
+                Tombstone.objects(owner=owner, deleted_at__gte=since_at).using(db)
+                .only("kind", "object_id").as_pymongo()
+            ):
+                deleted[raw["kind"]].append(str(raw["object_id"]))
+        return schemas.SyncChanges.model_construct(
+            token=token,
+            reset=reset,
+            cards=[_card_raw_to_response(raw) for raw in card_raws],
+            decks=[
+                schemas.SyncDeck.model_construct(
+                    id=str(raw["_id"]),
+                    name=raw.get("name"),
+                    description=raw.get("description"),
+                    card_ids=[str(card_id) for card_id in raw.get("cards") or []],
+                    last_edited=raw.get("last_edited"),
+                )
+                for raw in deck_raws
+            ],
+            deleted_card_ids=deleted["card"],
+            deleted_deck_ids=deleted["deck"],
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -551,11 +1340,20 @@ def get_book(
 
 
 def list_books(
-    skip: int, limit: int, db: str = "default", owner: User = None
-) -> list[schemas.BookResponse]:
+    skip: int, limit: int, db: str = "default", owner: User = None,
+    cursor: str | None = None,
+) -> tuple[list[schemas.BookResponse], str | None]:
+    after = parse_cursor(cursor)
     try:
-        books = Book.objects(owner=owner).using(db).skip(skip).limit(limit)
-        return [_book_to_response(b) for b in books]
+        query = Book.objects(owner=owner)
+        if after:
+            query = query.filter(id__gt=after)
+        raws = list(
+            query.using(db).only(*BOOK_FIELDS).order_by("id")
+            .skip(skip).limit(limit + 1).as_pymongo()
+        )
+        next_cursor = str(raws[limit - 1]["_id"]) if len(raws) > limit else None
+        return [_book_raw_to_response(raw) for raw in raws[:limit]], next_cursor
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -567,22 +1365,18 @@ def update_book(
     owner: User = None,
 ) -> schemas.BookResponse | None:
     try:
-        book = Book.objects.using(db).get(id=ObjectId(book_id), owner=owner)
-        if book_update.title is not None:
-            book.title = book_update.title
-        if book_update.target_language is not None:
-            book.target_language = book_update.target_language
-        if book_update.native_language is not None:
-            book.native_language = book_update.native_language
+        values = {
+            field: getattr(book_update, field)
+            for field in ("title", "target_language", "native_language")
+            if getattr(book_update, field) is not None
+        }
         if book_update.chapters is not None:
-            book.chapters = [
+            values["chapters"] = [
                 Chapter(name=ch.name, start_page=ch.start_page, end_page=ch.end_page)
                 for ch in book_update.chapters
             ]
-        book.save(using=db)
-        return _book_to_response(book)
-    except Book.DoesNotExist:
-        return None
+        raw = _update_owned(Book, book_id, values, BOOK_FIELDS, db, owner)
+        return _book_raw_to_response(raw) if raw else None
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -811,9 +1605,10 @@ def generate_from_image(
                 generation_batch_id=batch_id,
                 owner=owner,
             )
-        draft.save(using=db)
         drafts.append(draft)
 
+    bulk_insert(drafts, db)
+
     if source_page is not None:
         # Mark the single source page as processed so subsequent
         # next-batch calls skip it.
@@ -929,9 +1724,10 @@ def _generate_and_store_drafts(
                 generation_batch_id=batch_id,
                 owner=owner,
             )
-        draft.save(using=db)
         drafts.append(draft)
 
+    bulk_insert(drafts, db)
+
     # 4. Update progress
     add_processed_pages(str(book.id), start_page, end_page, db, owner)
 
@@ -981,8 +1777,8 @@ def create_book_metadata(
         ]
     book.save(using=db)
 
-    owner.file_count += 1
-    owner.save(using=db)
+    User.objects(id=owner.id).using(db).update_one(inc__file_count=1)
+    invalidate_user(owner.username)
 
     progress = BookProgress(book=book, owner=owner)
     progress.save(using=db)
@@ -1124,9 +1920,10 @@ def generate_from_images(
                 generation_batch_id=batch_id,
                 owner=owner,
             )
-        draft.save(using=db)
         drafts.append(draft)
 
+    bulk_insert(drafts, db)
+
     if pages:
         # Mark the contiguous span as processed; gaps inside the
         # supplied page list are tolerated and treated as covered for
@@ -1150,50 +1947,26 @@ def generate_from_images(
 
 # ---- Draft Review ----
 
-def list_drafts(
-    book_id: str = None, batch_id: str = None, status: str = "pending",
-    skip: int = 0, limit: int = 50,
-    db: str = "default", owner: User = None,
-) -> list[schemas.DraftCardResponse]:
-    try:
-        query = {"owner": owner}
-        if book_id:
-            query["book"] = ObjectId(book_id)
-        if batch_id:
-            query["generation_batch_id"] = batch_id
-        if status:
-            query["status"] = status
-        drafts = DraftCard.objects(**query).using(db).skip(skip).limit(limit)
-        return [_draft_to_response(d) for d in drafts]
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
-
-
 def update_draft(
     draft_id: str, draft_update: schemas.DraftCardUpdate,
     db: str = "default", owner: User = None,
 ) -> schemas.DraftCardResponse | None:
     try:
-        draft = DraftCard.objects.using(db).get(id=ObjectId(draft_id), owner=owner)
+        values = {}
         for field in [
             "front", "back", "part_of_speech", "gender", "plural_form",
-            "pronunciation", "notes",
+            "pronunciation", "notes", "synonyms", "antonyms", "tags",
         ]:
             value = getattr(draft_update, field, None)
             if value is not None:
-                setattr(draft, field, value)
+                values[field] = value
         if draft_update.examples is not None:
-            draft.examples = _examples_to_embedded(draft_update.examples)
-        if draft_update.synonyms is not None:
-            draft.synonyms = draft_update.synonyms
-        if draft_update.antonyms is not None:
-            draft.antonyms = draft_update.antonyms
-        if draft_update.tags is not None:
-            draft.tags = draft_update.tags
-        draft.save(using=db)
-        return _draft_to_response(draft)
-    except DraftCard.DoesNotExist:
-        return None
+            values["examples"] = _examples_to_embedded(draft_update.examples)
+        # Drafts have no last_edited field.
+        raw = _update_owned(
+            DraftCard, draft_id, values, DRAFT_FIELDS, db, owner, touch=False
+        )
+        return _draft_raw_to_response(raw) if raw else None
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -1203,7 +1976,11 @@ def approve_draft(
     db: str = "default", owner: User = None,
 ) -> schemas.Card | None:
     try:
-        draft = DraftCard.objects.using(db).get(id=ObjectId(draft_id), owner=owner)
+        # The template and book are only copied across by id.
+        draft = (
+            DraftCard.objects.using(db).no_dereference()
+            .get(id=ObjectId(draft_id), owner=owner)
+        )
 
         card = Card(
             front=draft.front,
@@ -1224,6 +2001,7 @@ def approve_draft(
             owner=owner,
         )
         card.save(using=db)
+        _cards_changed(owner)
 
         if deck_id:
             deck = Deck.objects.using(db).get(id=ObjectId(deck_id), owner=owner)
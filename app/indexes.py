@@ -0,0 +1,176 @@
+"""
+Index management entry point.
+
+    python -m app.indexes            # build indexes, then check query plans
+    python -m app.indexes --check    # only check query plans
+
+Indexes are declared in each model's ``meta`` and built in the background.
+Building also backfills ``next_due`` on cards created before the review
+scheduler existed, so they show up in the due-queue index.
+The check step explains the query shapes used by crud.py / async_crud.py
+and reports any whose winning plan falls back to a COLLSCAN.
+"""
+
+import argparse
+import sys
+from datetime import datetime
+
+from bson import ObjectId
+
+from .database import connect_db, disconnect_db
+from .models import (
+    Book,
+    BookProgress,
+    Card,
+    Deck,
+    DraftCard,
+    ReviewEvent,
+    Template,
+    Tombstone,
+    User,
+)
+
+MODELS = [
+    User,
+    Template,
+    Book,
+    BookProgress,
+    Card,
+    Deck,
+    DraftCard,
+    Tombstone,
+    ReviewEvent,
+]
+
+_OWNER = ObjectId()
+_SINCE = datetime(2000, 1, 1)
+
+# (label, model, filter, sort) for the hot query shapes.
+QUERY_SHAPES = [
+    ("user by username", User, {"username": "x"}, None),
+    ("cards by owner", Card, {"owner": _OWNER}, [("_id", 1)]),
+    (
+        "cards by owner after cursor",
+        Card,
+        {"owner": _OWNER, "_id": {"$gt": _OWNER}},
+        [("_id", 1)],
+    ),
+    ("cards by owner and tag", Card, {"owner": _OWNER, "tags": "x"}, None),
+    (
+        "tag catalog",
+        Card,
+        {"owner": _OWNER, "tags": {"$exists": True, "$ne": []}},
+        None,
+    ),
+    ("cards recently edited", Card, {"owner": _OWNER}, [("last_edited", -1)]),
+    (
+        "cards due for review",
+        Card,
+        {"owner": _OWNER, "$or": [{"next_due": {"$lte": _SINCE}}, {"next_due": None}]},
+        [("next_due", 1)],
+    ),
+    ("decks by owner", Deck, {"owner": _OWNER}, [("_id", 1)]),
+    (
+        "cards changed since",
+        Card,
+        {"owner": _OWNER, "last_edited": {"$gte": _SINCE}},
+        None,
+    ),
+    (
+        "decks changed since",
+        Deck,
+        {"owner": _OWNER, "last_edited": {"$gte": _SINCE}},
+        None,
+    ),
+    (
+        "deletions since",
+        Tombstone,
+        {"owner": _OWNER, "deleted_at": {"$gte": _SINCE}},
+        None,
+    ),
+    (
+        "review events since",
+        ReviewEvent,
+        {"owner": _OWNER, "ts": {"$gte": _SINCE}},
+        [("ts", 1)],
+    ),
+    ("books by owner", Book, {"owner": _OWNER}, [("_id", 1)]),
+    ("book progress", BookProgress, {"book": _OWNER, "owner": _OWNER}, None),
+    (
+        "drafts by owner and status",
+        DraftCard,
+        {"owner": _OWNER, "status": "pending"},
+        [("_id", 1)],
+    ),
+    (
+        "drafts by owner, status and book",
+        DraftCard,
+        {"owner": _OWNER, "status": "pending", "book": _OWNER},
+        [("_id", 1)],
+    ),
+    ("templates by owner", Template, {"owner": _OWNER}, None),
+]
+
+
+def build_indexes():
+    for model in MODELS:
+        model.ensure_indexes()
+        print(f"Ensured indexes for {model._get_collection_name()}")
+
+
+def backfill_next_due():
+    """Makes never-scheduled cards due from their creation date."""
+    result = Card._get_collection().update_many(
+        {"next_due": {"$exists": False}},
+        [{"$set": {"next_due": {"$ifNull": ["$date_created", "$$NOW"]}}}],
+    )
+    print(f"Backfilled next_due on {result.modified_count} cards")
+
+
+def _plan_stages(plan: dict):
+    yield plan.get("stage")
+    for key in ("inputStage", "queryPlan"):
+        if key in plan:
+            yield from _plan_stages(plan[key])
+    for child in plan.get("inputStages", []):
+        yield from _plan_stages(child)
+
+
+def find_collscans() -> list[str]:
+    """Returns the labels of query shapes whose winning plan is a COLLSCAN."""
+    collscans = []
+    for label, model, filter_, sort in QUERY_SHAPES:
+        cursor = model._get_collection().find(filter_)
+        if sort:
+            cursor = cursor.sort(sort)
+        winning_plan = cursor.explain()["queryPlanner"]["winningPlan"]
+        if "COLLSCAN" in set(_plan_stages(winning_plan)):
+            collscans.append(label)
+    return collscans
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Build and verify MongoDB indexes.")
+    parser.add_argument(
+        "--check", action="store_true", help="only report query shapes that COLLSCAN"
+    )
+    args = parser.parse_args(argv)
+
+    connect_db()
+    try:
+        if not args.check:
+            build_indexes()
+            backfill_next_due()
+        collscans = find_collscans()
+    finally:
+        disconnect_db()
+
+    for label in collscans:
+        print(f"COLLSCAN: {label}")
+    if not collscans:
+        print(f"All {len(QUERY_SHAPES)} query shapes use an index")
+    return 1 if collscans else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,16 +1,47 @@
+import os
 from fastapi import FastAPI
-from .routers import decks, cards, search, auth, books, generation, storage, templates
+from .routers import (
+    decks,
+    cards,
+    search,
+    auth,
+    books,
+    generation,
+    storage,
+    templates,
+    sync,
+    review,
+    debug,
+)
 from .utils.logger import logger
 from .exceptions import http_exception_handler
 from fastapi.exceptions import RequestValidationError, HTTPException
-from fastapi.responses import JSONResponse
-from .database import connect_db, disconnect_db
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
+from .database import (
+    READ_ALIAS,
+    connect_db,
+    connect_read_db,
+    connect_async_db,
+    disconnect_async_db,
+    disconnect_db,
+)
 from .crud import seed_default_templates
+from .utils.profiling import QueryProfilerMiddleware
+from .utils.compression import CompressionMiddleware
+from .utils.review_log import review_log
 
 app = FastAPI(
     title="Flashcard API",
     description="API for managing flashcards and decks with user authentication",
     version="0.1.0",
+    default_response_class=ORJSONResponse,
+)
+
+debug_endpoints_enabled = os.getenv("ENABLE_DEBUG_ENDPOINTS", "").lower() in (
+    "1",
+    "true",
+    "yes",
 )
 
 origins = [
@@ -18,25 +49,34 @@ origins = [
     "http://localhost:3000",
 ]
 
-from fastapi.middleware.cors import CORSMiddleware
-
 app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Server-Timing", "X-Next-Cursor"],
 )
 
+app.add_middleware(QueryProfilerMiddleware, keep_history=debug_endpoints_enabled)
+
+app.add_middleware(CompressionMiddleware)
+
 
 @app.on_event("startup")
 def startup_db_client():
     connect_db()
+    connect_read_db()
+    connect_async_db()
     seed_default_templates()
+    review_log.start()
 
 
 @app.on_event("shutdown")
-def shutdown_db_client():
+async def shutdown_db_client():
+    review_log.stop()
+    await disconnect_async_db()
+    disconnect_db(READ_ALIAS)
     disconnect_db()
 
 
@@ -48,6 +88,11 @@ app.include_router(books.router)
 app.include_router(generation.router)
 app.include_router(storage.router)
 app.include_router(templates.router)
+app.include_router(sync.router)
+app.include_router(review.router)
+
+if debug_endpoints_enabled:
+    app.include_router(debug.router)
 
 
 @app.exception_handler(HTTPException)
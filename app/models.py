@@ -12,11 +12,14 @@ from mongoengine import (
     EmbeddedDocumentField,
     DictField,
     BooleanField,
+    FloatField,
+    ObjectIdField,
     CASCADE,
 )
+import os
 from datetime import datetime
 from .schemas import HardnessLevel, DraftCardStatus
-import bcrypt
+from .utils.security import hash_password, verify_password
 
 
 class ExampleSentence(EmbeddedDocument):
@@ -66,14 +69,10 @@ class User(Document):
     meta = {"indexes": ["username", "email"]}
 
     def set_password(self, password: str):
-        self.hashed_password = bcrypt.hashpw(
-            password.encode("utf-8"), bcrypt.gensalt()
-        ).decode("utf-8")
+        self.hashed_password = hash_password(password)
 
     def check_password(self, password: str) -> bool:
-        return bcrypt.checkpw(
-            password.encode("utf-8"), self.hashed_password.encode("utf-8")
-        )
+        return verify_password(password, self.hashed_password)
 
 
 class TemplateField(EmbeddedDocument):
@@ -119,7 +118,10 @@ class Book(Document):
     last_edited = DateTimeField(default=datetime.utcnow)
     owner = ReferenceField(User, required=True, reverse_delete_rule=CASCADE)
 
-    meta = {"indexes": ["owner", "title", "storage_type"]}
+    meta = {
+        "indexes": [("owner", "id"), "title", "storage_type"],
+        "index_background": True,
+    }
 
     def clean(self):
         self.last_edited = datetime.utcnow()
@@ -145,6 +147,13 @@ class Card(Document):
     date_created = DateTimeField(default=datetime.utcnow)
     last_edited = DateTimeField(default=datetime.utcnow)
     last_visited = DateTimeField()
+    # Client clock of the last applied review update; later reviews win.
+    review_client_ts = DateTimeField()
+    # Spaced-repetition state, advanced by utils.scheduler on each review.
+    # New cards are due immediately.
+    next_due = DateTimeField(default=datetime.utcnow)
+    interval_days = FloatField()
+    ease = FloatField()
     source_book = ReferenceField(Book)
     source_page = IntField()
     owner = ReferenceField(User, required=True, reverse_delete_rule=CASCADE)
@@ -168,8 +177,12 @@ class Card(Document):
                     "notes": 3,
                 },
             },
-            "tags",
-        ]
+            ("owner", "id"),
+            ("owner", "tags"),
+            ("owner", "last_edited"),
+            ("owner", "next_due"),
+        ],
+        "index_background": True,
     }
 
     def clean(self):
@@ -184,12 +197,58 @@ class Deck(Document):
     last_edited = DateTimeField(default=datetime.utcnow)
     owner = ReferenceField(User, required=True, reverse_delete_rule=CASCADE)
 
-    meta = {"indexes": ["name"]}
+    meta = {
+        "indexes": [("owner", "id"), ("owner", "last_edited"), "name"],
+        "index_background": True,
+    }
 
     def clean(self):
         self.last_edited = datetime.utcnow()
 
 
+# How long deletions are remembered for delta sync. Clients whose sync
+# token is older than this must do a full resync.
+SYNC_TOMBSTONE_RETENTION_DAYS = int(os.getenv("SYNC_TOMBSTONE_RETENTION_DAYS", "30"))
+
+
+class Tombstone(Document):
+    """Marks a deleted card or deck so /sync/changes can report it."""
+    owner = ReferenceField(User, required=True, reverse_delete_rule=CASCADE)
+    kind = StringField(required=True, choices=("card", "deck"))
+    object_id = ObjectIdField(required=True)
+    deleted_at = DateTimeField(default=datetime.utcnow)
+
+    meta = {
+        "indexes": [
+            ("owner", "deleted_at"),
+            {
+                "fields": ["deleted_at"],
+                "expireAfterSeconds": SYNC_TOMBSTONE_RETENTION_DAYS * 24 * 3600,
+            },
+        ],
+        "index_background": True,
+    }
+
+
+class ReviewEvent(Document):
+    """
+    One review of a card. Append-only: written in batches by
+    utils.review_log and never updated. Events outlive their card so
+    retention can be analysed after cards are deleted.
+    """
+    owner = ReferenceField(User, required=True, reverse_delete_rule=CASCADE)
+    card_id = ObjectIdField(required=True)
+    hardness_level = EnumField(HardnessLevel)
+    # When the review happened, by the client's clock.
+    ts = DateTimeField(required=True)
+    received_at = DateTimeField(default=datetime.utcnow)
+
+    meta = {
+        "indexes": [("owner", "ts")],
+        "index_background": True,
+    }
+
+
 class BookProgress(Document):
     book = ReferenceField(Book, required=True, reverse_delete_rule=CASCADE)
     owner = ReferenceField(User, required=True, reverse_delete_rule=CASCADE)
@@ -239,5 +298,10 @@ class DraftCard(Document):
     owner = ReferenceField(User, required=True, reverse_delete_rule=CASCADE)
 
     meta = {
-        "indexes": ["owner", "book", "status", "generation_batch_id"]
+        "indexes": [
+            ("owner", "status", "book", "id"),
+            "book",
+            "generation_batch_id",
+        ],
+        "index_background": True,
     }
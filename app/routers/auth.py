@@ -1,34 +1,48 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordRequestForm
 from .. import schemas, crud
 from ..database import get_db
 from ..utils.token import create_access_token
+from ..utils.security import hash_password_async, verify_password_async, needs_rehash
 from datetime import timedelta
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
+# These handlers are async so that bcrypt runs on its dedicated pool (see
+# utils.security) while the short Mongo lookups go through the threadpool.
+
 
 @router.post("/register", response_model=schemas.UserOut)
-def register(user_create: schemas.UserCreate, db: str = Depends(get_db)):
-    user = crud.get_user_by_username(user_create.username, db)
+async def register(user_create: schemas.UserCreate, db: str = Depends(get_db)):
+    user = await run_in_threadpool(crud.get_user_by_username, user_create.username, db)
     if user:
         raise HTTPException(status_code=400, detail="Username already registered")
-    user = crud.get_user_by_email(user_create.email, db)
+    user = await run_in_threadpool(crud.get_user_by_email, user_create.email, db)
     if user:
         raise HTTPException(status_code=400, detail="Email already registered")
-    user = crud.create_user(user_create, db)
+    hashed_password = await hash_password_async(user_create.password)
+    user = await run_in_threadpool(crud.create_user, user_create, db, hashed_password)
     return user
 
 
 @router.post("/login", response_model=schemas.Token)
-def login(form_data: OAuth2PasswordRequestForm = Depends(), db: str = Depends(get_db)):
-    user = crud.authenticate_user(form_data.username, form_data.password, db)
-    if not user:
+async def login(
+    form_data: OAuth2PasswordRequestForm = Depends(), db: str = Depends(get_db)
+):
+    user = await run_in_threadpool(crud.get_user_by_username, form_data.username, db)
+    if not user or not await verify_password_async(
+        form_data.password, user.hashed_password
+    ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
+    # Transparently upgrade hashes created with a different cost factor.
+    if needs_rehash(user.hashed_password):
+        user.hashed_password = await hash_password_async(form_data.password)
+        await run_in_threadpool(user.save, using=db)
     access_token_expires = timedelta(minutes=30)
     access_token = create_access_token(
         data={"sub": user.username}, expires_delta=access_token_expires
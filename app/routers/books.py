@@ -1,13 +1,18 @@
-from fastapi import APIRouter, HTTPException, Depends, UploadFile, File, Form
+from fastapi import APIRouter, HTTPException, Depends, UploadFile, File, Form, Query
 from fastapi.responses import StreamingResponse
-from typing import List, Optional
 import io
-from .. import schemas, models, crud
-from ..database import get_db
+from .. import schemas, crud
+from ..database import get_db, get_read_db
 from ..models import User, Book
-from ..utils.token import get_current_user
+from ..utils.token import (
+    get_current_user,
+    get_current_user_with_quota,
+    get_current_user_with_storage,
+    invalidate_user,
+)
 from ..utils.storage_adapter import get_storage_adapter, AppDriveStorageAdapter
 from ..utils.gemini import get_pdf_page_count
+from ..utils.responses import json_response
 
 router = APIRouter(prefix="/books", tags=["books"])
 
@@ -17,7 +22,7 @@ MAX_PDF_SIZE_FREE = 10 * 1024 * 1024  # 10 MB for free tier
 @router.post("/", response_model=schemas.BookResponse)
 def create_book(
     book_create: schemas.BookCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_user_with_quota),
     db: str = Depends(get_db),
 ):
     """
@@ -36,7 +41,8 @@ async def upload_book(
     title: str = Form(...),
     target_language: str | None = Form(None),
     native_language: str | None = Form(None),
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_user_with_storage),
+    quota: User = Depends(get_current_user_with_quota),
     db: str = Depends(get_db),
 ):
     """
@@ -52,23 +58,23 @@ async def upload_book(
     file_size = len(file_bytes)
     
     # Validate file size against tier limit
-    if file_size > current_user.max_storage_bytes:
-        max_mb = current_user.max_storage_bytes / 1024 / 1024
+    if file_size > quota.max_storage_bytes:
+        max_mb = quota.max_storage_bytes / 1024 / 1024
         raise HTTPException(
             status_code=413,
             detail=f"File too large. Maximum size for your tier is {max_mb:.0f} MB"
         )
 
     # Check quota: file count
-    if current_user.file_count >= current_user.max_files:
+    if quota.file_count >= quota.max_files:
         raise HTTPException(
             status_code=400,
-            detail=f"File limit reached ({current_user.max_files} files). Delete some files or upgrade your plan."
+            detail=f"File limit reached ({quota.max_files} files). Delete some files or upgrade your plan."
         )
 
     # Check quota: storage space
-    if current_user.storage_used_bytes + file_size > current_user.max_storage_bytes:
-        remaining_mb = (current_user.max_storage_bytes - current_user.storage_used_bytes) / 1024 / 1024
+    if quota.storage_used_bytes + file_size > quota.max_storage_bytes:
+        remaining_mb = (quota.max_storage_bytes - quota.storage_used_bytes) / 1024 / 1024
         raise HTTPException(
             status_code=400,
             detail=f"Insufficient storage space. You have {remaining_mb:.2f} MB remaining."
@@ -132,9 +138,10 @@ async def upload_book(
         book.save(using=db)
         
         # Update user quota
-        current_user.storage_used_bytes += file_size
-        current_user.file_count += 1
-        current_user.save(using=db)
+        User.objects(id=current_user.id).using(db).update_one(
+            inc__storage_used_bytes=file_size, inc__file_count=1
+        )
+        invalidate_user(current_user.username)
         
         # Auto-create progress tracker
         from ..models import BookProgress
@@ -161,27 +168,17 @@ async def upload_book(
 
 @router.get("/", response_model=list[schemas.BookResponse])
 def list_books(
-    skip: int = 0,
-    limit: int = 100,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=crud.MAX_PAGE_SIZE),
+    cursor: str | None = None,
     current_user: User = Depends(get_current_user),
-    db: str = Depends(get_db),
+    db: str = Depends(get_read_db),
 ):
     """List all books owned by the current user"""
-    books = Book.objects(owner=current_user).skip(skip).limit(limit).using(db)
-    return [
-        schemas.BookResponse(
-            id=str(book.id),
-            title=book.title,
-            filename=book.filename,
-            total_pages=book.total_pages,
-            chapters=[schemas.ChapterSchema(**c.to_mongo().to_dict()) for c in (book.chapters or [])],
-            target_language=book.target_language,
-            native_language=book.native_language,
-            date_created=book.date_created,
-            last_edited=book.last_edited,
-        )
-        for book in books
-    ]
+    books, next_cursor = crud.list_books(skip, limit, db, owner=current_user, cursor=cursor)
+    return json_response(
+        list[schemas.BookResponse], books, headers=crud.next_cursor_headers(next_cursor)
+    )
 
 
 @router.get("/{book_id}", response_model=schemas.BookResponse)
@@ -212,7 +209,7 @@ def get_book(
 @router.get("/{book_id}/download")
 async def download_book(
     book_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_user_with_storage),
     db: str = Depends(get_db),
 ):
     """
@@ -264,44 +261,16 @@ def update_book(
     db: str = Depends(get_db),
 ):
     """Update book metadata (title, languages, chapters)"""
-    from bson import ObjectId
-    book = Book.objects(id=ObjectId(book_id), owner=current_user).using(db).first()
+    book = crud.update_book(book_id, book_update, db, owner=current_user)
     if not book:
         raise HTTPException(status_code=404, detail="Book not found")
-    
-    # Update fields
-    if book_update.title is not None:
-        book.title = book_update.title
-    if book_update.target_language is not None:
-        book.target_language = book_update.target_language
-    if book_update.native_language is not None:
-        book.native_language = book_update.native_language
-    if book_update.chapters is not None:
-        from ..models import Chapter
-        book.chapters = [
-            Chapter(name=c.name, start_page=c.start_page, end_page=c.end_page)
-            for c in book_update.chapters
-        ]
-    
-    book.save(using=db)
-    
-    return schemas.BookResponse(
-        id=str(book.id),
-        title=book.title,
-        filename=book.filename,
-        total_pages=book.total_pages,
-        chapters=[schemas.ChapterSchema(**c.to_mongo().to_dict()) for c in (book.chapters or [])],
-        target_language=book.target_language,
-        native_language=book.native_language,
-        date_created=book.date_created,
-        last_edited=book.last_edited,
-    )
+    return book
 
 
 @router.delete("/{book_id}")
 async def delete_book(
     book_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_user_with_storage),
     db: str = Depends(get_db),
 ):
     """
@@ -339,11 +308,17 @@ async def delete_book(
         # Delete book record (cascades to progress, draft cards, etc.)
         book.delete(using=db)
 
-        # Update user quota
+        # Update user quota. Atomic decrement; the filter keeps the
+        # counters from going negative if they have drifted.
         if file_size > 0:
-            current_user.storage_used_bytes = max(0, current_user.storage_used_bytes - file_size)
-            current_user.file_count = max(0, current_user.file_count - 1)
-            current_user.save(using=db)
+            User.objects(
+                id=current_user.id,
+                storage_used_bytes__gte=file_size,
+                file_count__gte=1,
+            ).using(db).update_one(
+                inc__storage_used_bytes=-file_size, inc__file_count=-1
+            )
+            invalidate_user(current_user.username)
 
         return {"detail": "Book and associated data deleted successfully"}
 
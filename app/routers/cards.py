@@ -1,38 +1,13 @@
-from fastapi import APIRouter, HTTPException, Depends
-from typing import List
-from .. import schemas, crud
-from ..database import get_db
+from fastapi import APIRouter, HTTPException, Depends, Query
+from pymongo.asynchronous.database import AsyncDatabase
+from .. import schemas, crud, async_crud
+from ..database import get_db, get_async_db, get_async_read_db
 from ..models import User
-from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError
-from ..utils.token import verify_token
+from ..utils.token import get_async_current_user, get_current_user
+from ..utils.responses import json_response
 
 router = APIRouter(prefix="/cards", tags=["cards"])
 
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
-
-
-def get_current_user(
-    token: str = Depends(oauth2_scheme), db: str = Depends(get_db)
-) -> User:
-    credentials_exception = HTTPException(
-        status_code=401,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-    try:
-        payload = verify_token(token, credentials_exception)
-        username: str = payload.get("sub")
-        if username is None:
-            raise credentials_exception
-        token_data = schemas.TokenData(username=username)
-    except JWTError:
-        raise credentials_exception
-    user = crud.get_user_by_username(token_data.username, db)
-    if user is None:
-        raise credentials_exception
-    return user
-
 
 @router.post("/", response_model=schemas.Card)
 def create_card(
@@ -43,13 +18,88 @@ def create_card(
     return crud.create_card(card, db, owner=current_user)
 
 
-@router.get("/{card_id}", response_model=schemas.Card)
-def get_card(
-    card_id: str,
+# Bulk, reviews, stats and tags routes are declared before /{card_id} so
+# "bulk", "reviews", "stats" and "tags" aren't read as ids.
+
+
+@router.get("/stats", response_model=schemas.CardStats)
+def card_stats(
+    current_user: User = Depends(get_current_user),
+    db: str = Depends(get_db),
+):
+    """
+    Card counts by hardness, top tags, per-book counts and recently edited
+    cards for dashboards, without downloading the full card set. Cached
+    per worker; other workers may lag a write by up to the cache TTL.
+    """
+    return json_response(schemas.CardStats, crud.card_stats(db, owner=current_user))
+
+
+@router.get("/tags", response_model=list[schemas.TagCount])
+def card_tags(
+    prefix: str | None = None,
+    limit: int | None = Query(None, ge=1, le=crud.MAX_PAGE_SIZE),
+    current_user: User = Depends(get_current_user),
+    db: str = Depends(get_db),
+):
+    """The caller's tags with card counts, most used first."""
+    tags = crud.card_tags(prefix, limit, db, owner=current_user)
+    return json_response(list[schemas.TagCount], tags)
+
+
+@router.post("/bulk", response_model=schemas.CardBulkResponse)
+def bulk_create_cards(
+    request: schemas.CardBulkCreate,
+    current_user: User = Depends(get_current_user),
+    db: str = Depends(get_db),
+):
+    return crud.bulk_create_cards(request.cards, db, owner=current_user)
+
+
+@router.patch("/bulk", response_model=schemas.CardBulkResponse)
+def bulk_update_cards(
+    request: schemas.CardBulkUpdate,
+    current_user: User = Depends(get_current_user),
+    db: str = Depends(get_db),
+):
+    return crud.bulk_update_cards(request.cards, db, owner=current_user)
+
+
+@router.delete("/bulk", response_model=schemas.CardBulkResponse)
+def bulk_delete_cards(
+    request: schemas.CardBulkDelete,
+    current_user: User = Depends(get_current_user),
+    db: str = Depends(get_db),
+):
+    return crud.bulk_delete_cards(request.ids, db, owner=current_user)
+
+
+@router.post("/reviews", response_model=schemas.CardBulkResponse)
+def apply_card_reviews(
+    request: schemas.CardReviewBatch,
     current_user: User = Depends(get_current_user),
     db: str = Depends(get_db),
 ):
-    card = crud.get_card(card_id, db, owner=current_user)
+    """
+    Records reviews (hardness and last_visited), one or a queued offline
+    batch per request. This is the review path: each applied rating
+    advances the card's schedule and every review is logged. For each
+    card the review with the newest ``client_ts`` wins; older ones are
+    reported as ``stale`` and can be dropped by the client.
+    """
+    return crud.apply_card_reviews(request.reviews, db, owner=current_user)
+
+
+@router.get("/{card_id}", response_model=schemas.Card)
+async def get_card(
+    card_id: str,
+    include: str | None = None,
+    current_user: User = Depends(get_async_current_user),
+    db: AsyncDatabase = Depends(get_async_db),
+):
+    card = await async_crud.get_card(
+        card_id, db, owner=current_user, include=crud.parse_include(include)
+    )
     if not card:
         raise HTTPException(status_code=404, detail="Card not found")
     return card
@@ -62,6 +112,10 @@ def update_card(
     current_user: User = Depends(get_current_user),
     db: str = Depends(get_db),
 ):
+    """
+    Edits a card. ``hardness_level`` is set as-is without rescheduling;
+    submit reviews through ``POST /cards/reviews``.
+    """
     card = crud.update_card(card_id, card_update, db, owner=current_user)
     if not card:
         raise HTTPException(status_code=404, detail="Card not found")
@@ -81,11 +135,36 @@ def delete_card(
 
 
 @router.get("/", response_model=list[schemas.Card])
-def list_cards(
-    skip: int = 0,
-    limit: int = 10,
-    current_user: User = Depends(get_current_user),
-    db: str = Depends(get_db),
+async def list_cards(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(10, ge=1, le=crud.MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    include: str | None = None,
+    fields: str | None = None,
+    current_user: User = Depends(get_async_current_user),
+    db: AsyncDatabase = Depends(get_async_read_db),
 ):
-    cards = crud.list_cards(skip, limit, db, owner=current_user)
-    return cards
+    """
+    Lists cards by id. Pass the ``X-Next-Cursor`` response header back as
+    ``cursor`` to fetch the next page; skip/limit still work. ``fields``
+    (e.g. ``front,back,hardness_level``) trims each card to those fields.
+    """
+    include_set = crud.parse_include(include)
+    selected = crud.parse_fields(
+        fields, crud.CARD_RESPONSE_FIELDS, include_set, crud.CARD_INCLUDE_FIELDS
+    )
+    cards, next_cursor = await async_crud.list_cards(
+        skip,
+        limit,
+        db,
+        owner=current_user,
+        include=include_set,
+        cursor=cursor,
+        fields=selected,
+    )
+    return json_response(
+        list[schemas.Card],
+        cards,
+        headers=crud.next_cursor_headers(next_cursor),
+        include={"__all__": set(selected)} if selected else None,
+    )
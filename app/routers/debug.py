@@ -0,0 +1,33 @@
+"""
+Opt-in diagnostics endpoints. Only mounted when ENABLE_DEBUG_ENDPOINTS
+is set, since they expose process-level counters.
+"""
+
+from fastapi import APIRouter, Depends
+from ..database import pool_stats
+from ..models import User
+from ..utils.token import get_current_user, cache_stats
+from ..utils.profiling import recent_queries
+
+router = APIRouter(prefix="/debug", tags=["debug"])
+
+
+@router.get("/cache")
+def get_cache_stats(current_user: User = Depends(get_current_user)):
+    """Hit/miss counters for the in-process auth caches of this worker."""
+    return cache_stats()
+
+
+@router.get("/pool")
+def get_pool_stats(current_user: User = Depends(get_current_user)):
+    """Mongo connection-pool configuration and counters for this worker."""
+    return pool_stats()
+
+
+@router.get("/queries")
+def get_recent_queries(limit: int = 50, current_user: User = Depends(get_current_user)):
+    """
+    Mongo command counts, DB time, slowest commands and repeated command
+    shapes for the most recent requests handled by this worker.
+    """
+    return recent_queries()[:limit]
@@ -1,39 +1,14 @@
-from fastapi import APIRouter, HTTPException, Depends
-from typing import List
-from .. import schemas, crud
-from ..database import get_db
+from fastapi import APIRouter, HTTPException, Depends, Query
+from typing import Literal
+from pymongo.asynchronous.database import AsyncDatabase
+from .. import schemas, crud, async_crud
+from ..database import get_db, get_async_db, get_async_read_db
 from ..models import User
-from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
-from ..utils.token import verify_token, SECRET_KEY, ALGORITHM
-from ..schemas import TokenData
+from ..utils.token import get_async_current_user, get_current_user
+from ..utils.responses import json_response
 
 router = APIRouter(prefix="/decks", tags=["decks"])
 
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
-
-
-def get_current_user(
-    token: str = Depends(oauth2_scheme), db: str = Depends(get_db)
-) -> User:
-    credentials_exception = HTTPException(
-        status_code=401,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-    try:
-        payload = verify_token(token, credentials_exception)
-        username: str = payload.get("sub")
-        if username is None:
-            raise credentials_exception
-        token_data = schemas.TokenData(username=username)
-    except JWTError:
-        raise credentials_exception
-    user = crud.get_user_by_username(token_data.username, db)
-    if user is None:
-        raise credentials_exception
-    return user
-
 
 @router.post("/", response_model=schemas.Deck)
 def create_deck(
@@ -45,15 +20,67 @@ def create_deck(
 
 
 @router.get("/{deck_id}", response_model=schemas.Deck)
-def get_deck(
+async def get_deck(
     deck_id: str,
-    current_user: User = Depends(get_current_user),
-    db: str = Depends(get_db),
+    include: str | None = None,
+    fields: str | None = None,
+    current_user: User = Depends(get_async_current_user),
+    db: AsyncDatabase = Depends(get_async_db),
 ):
-    deck = crud.get_deck(deck_id, db, owner=current_user)
+    """``fields`` (e.g. ``front,back``) trims each card of the deck."""
+    include_set = crud.parse_include(include)
+    selected = crud.parse_fields(
+        fields, crud.CARD_RESPONSE_FIELDS, include_set, crud.CARD_INCLUDE_FIELDS
+    )
+    deck = await async_crud.get_deck(
+        deck_id, db, owner=current_user, include=include_set, fields=selected
+    )
     if not deck:
         raise HTTPException(status_code=404, detail="Deck not found")
-    return deck
+    return json_response(schemas.Deck, deck, include=crud.deck_fields_include(selected))
+
+
+@router.get("/{deck_id}/cards", response_model=list[schemas.Card])
+async def list_deck_cards(
+    deck_id: str,
+    limit: int = Query(50, ge=1, le=crud.MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    sort: Literal["position", "hardness", "last_visited"] = "position",
+    include: str | None = None,
+    fields: str | None = None,
+    current_user: User = Depends(get_async_current_user),
+    db: AsyncDatabase = Depends(get_async_db),
+):
+    """
+    Pages through a deck's cards without loading the whole deck. Pass the
+    ``X-Next-Cursor`` response header back as ``cursor`` for the next
+    page. ``sort`` is deck order (default), ``hardness`` (hardest first)
+    or ``last_visited`` (least recently visited first). ``fields`` trims
+    each card.
+    """
+    include_set = crud.parse_include(include)
+    selected = crud.parse_fields(
+        fields, crud.CARD_RESPONSE_FIELDS, include_set, crud.CARD_INCLUDE_FIELDS
+    )
+    page = await async_crud.list_deck_cards(
+        deck_id,
+        limit,
+        db,
+        owner=current_user,
+        sort=sort,
+        cursor=cursor,
+        include=include_set,
+        fields=selected,
+    )
+    if page is None:
+        raise HTTPException(status_code=404, detail="Deck not found")
+    cards, next_cursor = page
+    return json_response(
+        list[schemas.Card],
+        cards,
+        headers=crud.next_cursor_headers(next_cursor),
+        include={"__all__": set(selected)} if selected else None,
+    )
 
 
 @router.put("/{deck_id}", response_model=schemas.Deck)
@@ -81,12 +108,57 @@ def delete_deck(
     return {"detail": "Deck deleted successfully"}
 
 
-@router.get("/", response_model=list[schemas.Deck])
-def list_decks(
-    skip: int = 0,
-    limit: int = 10,
-    current_user: User = Depends(get_current_user),
-    db: str = Depends(get_db),
+@router.get("/", response_model=list[schemas.DeckSummary] | list[schemas.Deck])
+async def list_decks(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(10, ge=1, le=crud.MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    view: Literal["summary", "full"] = "summary",
+    include: str | None = None,
+    fields: str | None = None,
+    current_user: User = Depends(get_async_current_user),
+    db: AsyncDatabase = Depends(get_async_read_db),
 ):
-    decks = crud.list_decks(skip, limit, db, owner=current_user)
-    return decks
+    """
+    Lists decks by id. Pass the ``X-Next-Cursor`` response header back as
+    ``cursor`` to fetch the next page; skip/limit still work.
+
+    By default each deck is a summary with ``card_count`` instead of its
+    cards. ``view=full`` embeds the cards; ``include`` and ``fields``
+    (e.g. ``front,back``) apply to those cards; passing them with the
+    summary view is a 400.
+    """
+    if view == "summary":
+        if include or fields:
+            raise HTTPException(
+                status_code=400, detail="include and fields require view=full"
+            )
+        summaries, next_cursor = await async_crud.list_deck_summaries(
+            skip, limit, db, owner=current_user, cursor=cursor
+        )
+        return json_response(
+            list[schemas.DeckSummary],
+            summaries,
+            headers=crud.next_cursor_headers(next_cursor),
+        )
+
+    include_set = crud.parse_include(include)
+    selected = crud.parse_fields(
+        fields, crud.CARD_RESPONSE_FIELDS, include_set, crud.CARD_INCLUDE_FIELDS
+    )
+    decks, next_cursor = await async_crud.list_decks(
+        skip,
+        limit,
+        db,
+        owner=current_user,
+        include=include_set,
+        cursor=cursor,
+        fields=selected,
+    )
+    deck_include = crud.deck_fields_include(selected)
+    return json_response(
+        list[schemas.Deck],
+        decks,
+        headers=crud.next_cursor_headers(next_cursor),
+        include={"__all__": deck_include} if deck_include else None,
+    )
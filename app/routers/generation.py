@@ -1,38 +1,13 @@
-from fastapi import APIRouter, HTTPException, Depends
-from typing import List, Optional
-from .. import schemas, crud
-from ..database import get_db
+from fastapi import APIRouter, HTTPException, Depends, Query
+from pymongo.asynchronous.database import AsyncDatabase
+from .. import schemas, crud, async_crud
+from ..database import get_db, get_async_read_db
 from ..models import User
-from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError
-from ..utils.token import verify_token
+from ..utils.token import get_async_current_user, get_current_user
+from ..utils.responses import json_response
 
 router = APIRouter(prefix="/generate", tags=["generation"])
 
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
-
-
-def get_current_user(
-    token: str = Depends(oauth2_scheme), db: str = Depends(get_db)
-) -> User:
-    credentials_exception = HTTPException(
-        status_code=401,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-    try:
-        payload = verify_token(token, credentials_exception)
-        username: str = payload.get("sub")
-        if username is None:
-            raise credentials_exception
-        token_data = schemas.TokenData(username=username)
-    except JWTError:
-        raise credentials_exception
-    user = crud.get_user_by_username(token_data.username, db)
-    if user is None:
-        raise credentials_exception
-    return user
-
 
 # ---- Generation Endpoints ----
 
@@ -132,16 +107,31 @@ def generate_from_image(
 # ---- Draft Review Endpoints ----
 
 @router.get("/drafts", response_model=list[schemas.DraftCardResponse])
-def list_drafts(
+async def list_drafts(
     book_id: str | None = None,
     batch_id: str | None = None,
     status: str = "pending",
-    skip: int = 0,
-    limit: int = 50,
-    current_user: User = Depends(get_current_user),
-    db: str = Depends(get_db),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=crud.MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    include: str | None = None,
+    fields: str | None = None,
+    current_user: User = Depends(get_async_current_user),
+    db: AsyncDatabase = Depends(get_async_read_db),
 ):
-    return crud.list_drafts(book_id, batch_id, status, skip, limit, db, owner=current_user)
+    include_set = crud.parse_include(include)
+    selected = crud.parse_fields(
+        fields, crud.DRAFT_RESPONSE_FIELDS, include_set, crud.DRAFT_INCLUDE_FIELDS
+    )
+    drafts, next_cursor = await async_crud.list_drafts(
+        book_id, batch_id, status, skip, limit, db, owner=current_user,
+        include=include_set, cursor=cursor, fields=selected,
+    )
+    return json_response(
+        list[schemas.DraftCardResponse], drafts,
+        headers=crud.next_cursor_headers(next_cursor),
+        include={"__all__": set(selected)} if selected else None,
+    )
 
 
 @router.put("/drafts/{draft_id}", response_model=schemas.DraftCardResponse)
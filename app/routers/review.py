@@ -0,0 +1,28 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from pymongo.asynchronous.database import AsyncDatabase
+from .. import schemas, crud, async_crud
+from ..database import get_async_db
+from ..models import User
+from ..utils.token import get_async_current_user
+from ..utils.responses import json_response
+
+router = APIRouter(prefix="/review", tags=["review"])
+
+
+@router.get("/due", response_model=list[schemas.Card])
+async def list_due_cards(
+    deck_id: str | None = None,
+    limit: int = Query(20, ge=1, le=crud.MAX_PAGE_SIZE),
+    current_user: User = Depends(get_async_current_user),
+    db: AsyncDatabase = Depends(get_async_db),
+):
+    """
+    The ``limit`` most overdue cards, optionally within one deck. Reviews
+    are submitted through ``POST /cards/reviews``, which reschedules each
+    card. Reads from the primary so a just-reviewed card is not served
+    again from a lagging secondary.
+    """
+    cards = await async_crud.list_due_cards(deck_id, limit, db, owner=current_user)
+    if cards is None:
+        raise HTTPException(status_code=404, detail="Deck not found")
+    return json_response(list[schemas.Card], cards)
@@ -1,51 +1,35 @@
-from fastapi import APIRouter, Depends, HTTPException
-from typing import Optional
-from .. import schemas, crud
-from ..database import get_db
+from fastapi import APIRouter, Depends, HTTPException, Query
+from pymongo.asynchronous.database import AsyncDatabase
+from .. import schemas, crud, async_crud
+from ..database import get_async_read_db
 from ..models import User
-from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
-from ..utils.token import verify_token, SECRET_KEY, ALGORITHM
+from ..utils.token import get_async_current_user
+from ..utils.responses import json_response
 
 router = APIRouter(prefix="/search", tags=["search"])
 
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
-
-
-def get_current_user(
-    token: str = Depends(oauth2_scheme), db: str = Depends(get_db)
-) -> User:
-    credentials_exception = HTTPException(
-        status_code=401,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-    try:
-        payload = verify_token(token, credentials_exception)
-        username: str = payload.get("sub")
-        if username is None:
-            raise credentials_exception
-        token_data = schemas.TokenData(username=username)
-    except JWTError:
-        raise credentials_exception
-    user = crud.get_user_by_username(token_data.username, db)
-    if user is None:
-        raise credentials_exception
-    return user
-
 
 @router.get("/cards", response_model=schemas.SearchResponse)
-def search_cards(
+async def search_cards(
     query: str,
     cursor: str | None = None,
-    limit: int = 10,
-    current_user: User = Depends(get_current_user),
-    db: str = Depends(get_db),
+    limit: int = Query(10, ge=1, le=crud.MAX_PAGE_SIZE),
+    include: str | None = None,
+    current_user: User = Depends(get_async_current_user),
+    db: AsyncDatabase = Depends(get_async_read_db),
 ):
+    include_set = crud.parse_include(include)
     try:
-        results, next_cursor = crud.search_cards(
-            query, cursor, limit, db, owner=current_user
+        results, next_cursor = await async_crud.search_cards(
+            query, cursor, limit, db, owner=current_user, include=include_set
+        )
+        return json_response(
+            schemas.SearchResponse,
+            schemas.SearchResponse.model_construct(
+                results=results, next_cursor=next_cursor
+            ),
         )
-        return {"results": results, "next_cursor": next_cursor}
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
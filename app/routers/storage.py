@@ -10,7 +10,12 @@ import os
 from typing import Optional
 from .. import schemas, models
 from ..database import get_db
-from ..utils.token import get_current_user
+from ..utils.token import (
+    get_current_user,
+    get_current_user_with_quota,
+    get_current_user_with_storage,
+    invalidate_user,
+)
 from ..utils.storage_adapter import TelegramStorageAdapter
 
 router = APIRouter(prefix="/storage", tags=["storage"])
@@ -27,7 +32,7 @@ SCOPES = ['https://www.googleapis.com/auth/drive.file']
 def configure_telegram(
     config: schemas.TelegramStorageConfig,
     db: str = Depends(get_db),
-    current_user: models.User = Depends(get_current_user)
+    current_user: models.User = Depends(get_current_user_with_storage)
 ):
     """
     Configure Telegram storage for the current user.
@@ -48,14 +53,20 @@ def configure_telegram(
                 detail="Invalid Telegram bot token"
             )
         
-        # Update user's storage config
-        if not current_user.storage_config:
-            current_user.storage_config = models.UserStorageConfig()
-        
-        current_user.storage_config.storage_type = 'telegram'
-        current_user.storage_config.telegram_bot_token = config.bot_token
-        current_user.storage_config.telegram_user_id = config.user_id
-        current_user.save(using=db)
+        # Update user's storage config. current_user is the shared cached
+        # principal, so build a new config rather than mutating its copy.
+        current = current_user.storage_config
+        storage_config = models.UserStorageConfig(
+            storage_type='telegram',
+            telegram_bot_token=config.bot_token,
+            telegram_user_id=config.user_id,
+            google_credentials=current.google_credentials if current else None,
+            google_refresh_token=current.google_refresh_token if current else None,
+        )
+        models.User.objects(id=current_user.id).using(db).update_one(
+            set__storage_config=storage_config
+        )
+        invalidate_user(current_user.username)
         
         return {
             "message": "Telegram storage configured successfully",
@@ -180,7 +191,7 @@ async def google_drive_oauth_callback(
 @router.get("/config", response_model=schemas.StorageConfigResponse)
 def get_storage_config(
     db: str = Depends(get_db),
-    current_user: models.User = Depends(get_current_user)
+    current_user: models.User = Depends(get_current_user_with_storage)
 ):
     """
     Get current user's storage configuration and quota information.
@@ -203,7 +214,7 @@ def get_storage_config(
 
 @router.get("/quota", response_model=schemas.StorageQuota)
 def get_storage_quota(
-    current_user: models.User = Depends(get_current_user)
+    current_user: models.User = Depends(get_current_user_with_quota)
 ):
     """
     Get storage quota information for the current user.
@@ -220,7 +231,7 @@ def get_storage_quota(
 @router.post("/disconnect")
 def disconnect_storage(
     db: str = Depends(get_db),
-    current_user: models.User = Depends(get_current_user)
+    current_user: models.User = Depends(get_current_user_with_storage)
 ):
     """
     Disconnect current storage configuration.
@@ -232,7 +243,9 @@ def disconnect_storage(
             detail="Cannot disconnect storage while you have uploaded files. Delete all files first."
         )
     
-    current_user.storage_config = None
-    current_user.save(using=db)
+    models.User.objects(id=current_user.id).using(db).update_one(
+        unset__storage_config=True
+    )
+    invalidate_user(current_user.username)
     
     return {"message": "Storage disconnected successfully"}
@@ -0,0 +1,24 @@
+from fastapi import APIRouter, Depends
+from .. import schemas, crud
+from ..database import get_db
+from ..models import User
+from ..utils.token import get_current_user
+from ..utils.responses import json_response
+
+router = APIRouter(prefix="/sync", tags=["sync"])
+
+
+@router.get("/changes", response_model=schemas.SyncChanges)
+def get_changes(
+    since: str | None = None,
+    current_user: User = Depends(get_current_user),
+    db: str = Depends(get_db),
+):
+    """
+    Cards, decks and deletions changed since ``since`` (the ``token`` of
+    the previous call). Omit it for a full snapshot. Reads from the
+    primary: a lagging secondary could let the token skip past writes.
+    """
+    return json_response(
+        schemas.SyncChanges, crud.sync_changes(since, db, owner=current_user)
+    )
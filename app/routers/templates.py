@@ -3,36 +3,11 @@ from typing import List
 from .. import schemas, crud
 from ..database import get_db
 from ..models import User
-from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError
-from ..utils.token import verify_token
+from ..utils.token import get_current_user
+from ..utils.responses import json_response
 
 router = APIRouter(prefix="/templates", tags=["templates"])
 
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
-
-
-def get_current_user(
-    token: str = Depends(oauth2_scheme), db: str = Depends(get_db)
-) -> User:
-    credentials_exception = HTTPException(
-        status_code=401,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-    try:
-        payload = verify_token(token, credentials_exception)
-        username: str = payload.get("sub")
-        if username is None:
-            raise credentials_exception
-        token_data = schemas.TokenData(username=username)
-    except JWTError:
-        raise credentials_exception
-    user = crud.get_user_by_username(token_data.username, db)
-    if user is None:
-        raise credentials_exception
-    return user
-
 
 @router.post("/", response_model=schemas.TemplateResponse)
 def create_template(
@@ -89,4 +64,4 @@ def list_templates(
     db: str = Depends(get_db),
 ):
     templates = crud.list_templates(skip, limit, include_defaults, db, owner=current_user)
-    return templates
+    return json_response(list[schemas.TemplateResponse], templates)
@@ -145,8 +145,12 @@ class Card(CardBase):
     date_created: datetime
     last_edited: datetime
     last_visited: datetime | None = None
+    next_due: datetime | None = None
     source_book_id: str | None = None
     source_page: int | None = None
+    # Filled in only when requested with ?include=template,book
+    template: TemplateResponse | None = None
+    source_book: "BookResponse | None" = None
 
     class Config:
         from_attributes = True
@@ -178,11 +182,116 @@ class Deck(DeckBase):
         from_attributes = True
 
 
+class DeckSummary(DeckBase):
+    """A deck without its cards, as listed by GET /decks/."""
+    id: str
+    card_count: int
+    last_edited: datetime | None = None
+
+
+# Bulk card operations. Each call is capped at MAX_BULK_CARDS items and
+# reports one result per item, in request order.
+MAX_BULK_CARDS = 500
+
+
+class CardBulkCreate(BaseModel):
+    cards: list[CardCreate] = Field(min_length=1, max_length=MAX_BULK_CARDS)
+
+
+class CardBulkUpdateItem(CardUpdate):
+    id: str
+
+
+class CardBulkUpdate(BaseModel):
+    cards: list[CardBulkUpdateItem] = Field(min_length=1, max_length=MAX_BULK_CARDS)
+
+
+class CardBulkDelete(BaseModel):
+    ids: list[str] = Field(min_length=1, max_length=MAX_BULK_CARDS)
+
+
+class CardReviewUpdate(BaseModel):
+    card_id: str
+    hardness_level: HardnessLevel | None = None
+    last_visited: datetime | None = None
+    # When the review happened on the client; the newest one wins.
+    client_ts: datetime
+
+
+class CardReviewBatch(BaseModel):
+    reviews: list[CardReviewUpdate] = Field(min_length=1, max_length=MAX_BULK_CARDS)
+
+
+class BulkItemStatus(str, Enum):
+    CREATED = "created"
+    UPDATED = "updated"
+    DELETED = "deleted"
+    # A newer review of the card was already applied; nothing to retry.
+    STALE = "stale"
+    NOT_FOUND = "not_found"
+    INVALID = "invalid"
+
+
+class CardBulkItemResult(BaseModel):
+    index: int
+    id: str | None = None
+    status: BulkItemStatus
+    error: str | None = None
+    card: Card | None = None
+
+
+class CardBulkResponse(BaseModel):
+    succeeded: int
+    failed: int
+    results: list[CardBulkItemResult]
+
+
 class SearchResponse(BaseModel):
     results: list[Card]
     next_cursor: str | None = None
 
 
+# Delta sync
+class SyncDeck(BaseModel):
+    """A deck as seen by sync clients: card ids instead of embedded cards."""
+    id: str
+    name: str
+    description: str | None = None
+    card_ids: list[str]
+    last_edited: datetime | None = None
+
+
+class SyncChanges(BaseModel):
+    token: str
+    # True when the client's token was missing or too old to replay
+    # deletions: the response is a full snapshot and the client should
+    # replace its cache rather than merge into it.
+    reset: bool = False
+    cards: list[Card]
+    decks: list[SyncDeck]
+    deleted_card_ids: list[str]
+    deleted_deck_ids: list[str]
+
+
+# Card statistics
+class TagCount(BaseModel):
+    tag: str
+    count: int
+
+
+class BookCardCount(BaseModel):
+    book_id: str
+    count: int
+
+
+class CardStats(BaseModel):
+    total: int
+    by_hardness: dict[HardnessLevel, int]
+    top_tags: list[TagCount]
+    by_book: list[BookCardCount]
+    recently_edited: list[Card]
+
+
 # Book Schemas
 class BookBase(BaseModel):
     title: str
@@ -284,6 +393,9 @@ class DraftCardResponse(DraftCardBase):
     source_page_end: int | None = None
     generation_batch_id: str | None = None
     date_created: datetime
+    # Filled in only when requested with ?include=template,book
+    template: TemplateResponse | None = None
+    book: BookResponse | None = None
 
     class Config:
         from_attributes = True
@@ -376,3 +488,12 @@ class StorageConfigResponse(BaseModel):
     is_configured: bool
     quota: StorageQuota
 
+
+# Card refers to BookResponse, which is declared further down.
+Card.model_rebuild()
+Deck.model_rebuild()
+SearchResponse.model_rebuild()
+CardBulkItemResult.model_rebuild()
+CardBulkResponse.model_rebuild()
+CardStats.model_rebuild()
+SyncChanges.model_rebuild()
@@ -0,0 +1,81 @@
+"""
+Negotiated response compression for large JSON payloads.
+
+Clients that send ``Accept-Encoding: br`` get brotli, others gzip.
+Responses smaller than the threshold are sent as-is, since compressing
+them costs more than it saves, and so are media types that are already
+compressed (PDF book downloads, images, archives).
+"""
+
+import os
+
+from brotli_asgi import BrotliMiddleware
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipMiddleware
+
+COMPRESSION_MIN_BYTES = int(os.getenv("RESPONSE_COMPRESSION_MIN_BYTES", "1024"))
+GZIP_LEVEL = int(os.getenv("RESPONSE_GZIP_LEVEL", "6"))
+BROTLI_QUALITY = int(os.getenv("RESPONSE_BROTLI_QUALITY", "4"))
+
+PRECOMPRESSED_MEDIA_TYPES = (
+    "application/pdf",
+    "application/zip",
+    "application/gzip",
+    "application/x-gzip",
+    "application/x-7z-compressed",
+)
+PRECOMPRESSED_MEDIA_PREFIXES = ("image/", "audio/", "video/")
+
+
+def is_precompressed(content_type: str) -> bool:
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    if media_type == "image/svg+xml":
+        return False
+    return media_type in PRECOMPRESSED_MEDIA_TYPES or media_type.startswith(
+        PRECOMPRESSED_MEDIA_PREFIXES
+    )
+
+
+class CompressionMiddleware:
+    """
+    Picks brotli or gzip from the request's Accept-Encoding and routes
+    each response either through the compressor or, for precompressed
+    media types, straight to the client.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def route_by_media_type(scope, receive, compressed_send):
+            target = None
+
+            async def send_routed(message):
+                nonlocal target
+                if target is None:
+                    content_type = Headers(raw=message.get("headers", [])).get(
+                        "content-type", ""
+                    )
+                    target = send if is_precompressed(content_type) else compressed_send
+                await target(message)
+
+            await self.app(scope, receive, send_routed)
+
+        if "br" in Headers(scope=scope).get("accept-encoding", ""):
+            compressor = BrotliMiddleware(
+                route_by_media_type,
+                quality=BROTLI_QUALITY,
+                minimum_size=COMPRESSION_MIN_BYTES,
+                gzip_fallback=False,
+            )
+        else:
+            compressor = GZipMiddleware(
+                route_by_media_type,
+                minimum_size=COMPRESSION_MIN_BYTES,
+                compresslevel=GZIP_LEVEL,
+            )
+        await compressor(scope, receive, send)
@@ -0,0 +1,69 @@
+"""
+pymongo event listeners used to observe the connection pools.
+"""
+
+import threading
+from collections import defaultdict
+
+from pymongo import monitoring
+
+
+class PoolStatsListener(monitoring.ConnectionPoolListener):
+    """
+    Keeps running connection-pool counters per server address. One
+    instance is attached to each MongoClient so the sync (mongoengine)
+    and async clients are reported separately.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = defaultdict(lambda: defaultdict(int))
+
+    def _bump(self, address, **deltas):
+        key = "%s:%s" % address if address else "unknown"
+        with self._lock:
+            for name, delta in deltas.items():
+                self._stats[key][name] += delta
+
+    def pool_created(self, event):
+        self._bump(event.address, pools_created=1)
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        self._bump(event.address, pools_cleared=1)
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_created(self, event):
+        self._bump(event.address, connections_created=1, open=1)
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        self._bump(event.address, connections_closed=1, open=-1)
+
+    def connection_check_out_started(self, event):
+        self._bump(event.address, check_out_waiting=1)
+
+    def connection_check_out_failed(self, event):
+        self._bump(event.address, check_out_waiting=-1, check_out_failed=1)
+
+    def connection_checked_out(self, event):
+        self._bump(event.address, check_out_waiting=-1, checked_out=1, check_outs=1)
+
+    def connection_checked_in(self, event):
+        self._bump(event.address, checked_out=-1)
+
+    def snapshot(self) -> dict:
+        """
+        Current counters. ``open`` and ``checked_out`` are gauges, the
+        rest are totals since the client was created.
+        """
+        with self._lock:
+            return {
+                address: dict(counters) for address, counters in self._stats.items()
+            }
@@ -0,0 +1,216 @@
+"""
+Per-request MongoDB command profiling.
+
+A pymongo CommandListener attributes every command to the request that
+issued it (through a context variable set by QueryProfilerMiddleware),
+so each response can report how many round-trips it made and how long
+they took. The summary is sent as a ``Server-Timing`` header, optionally
+kept in a small in-memory ring buffer for ``/debug/queries``, and
+commands that repeat with the same shape are logged as likely N+1s.
+"""
+
+import os
+import threading
+import time
+from collections import Counter, deque
+from contextvars import ContextVar
+
+from pymongo import monitoring
+
+from .logger import logger
+
+QUERY_PROFILER_ENABLED = os.getenv("QUERY_PROFILER_ENABLED", "true").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+# Number of slowest commands kept per request.
+QUERY_PROFILER_SLOWEST = int(os.getenv("QUERY_PROFILER_SLOWEST", "5"))
+# Requests kept for /debug/queries.
+QUERY_PROFILER_HISTORY = int(os.getenv("QUERY_PROFILER_HISTORY", "200"))
+# Warn when one command shape runs this many times in a request (0 disables).
+QUERY_PROFILER_REPEAT_WARNING = int(os.getenv("QUERY_PROFILER_REPEAT_WARNING", "5"))
+
+_current_profile: ContextVar["RequestProfile | None"] = ContextVar(
+    "query_profile", default=None
+)
+
+
+def _skeleton(value):
+    """Replaces the values in a filter with placeholders, keeping its shape."""
+    if isinstance(value, dict):
+        return {key: _skeleton(item) for key, item in sorted(value.items())}
+    if isinstance(value, (list, tuple)):
+        return [_skeleton(value[0])] if value else []
+    return "?"
+
+
+def command_shape(command_name: str, command) -> str:
+    """
+    A value-free description of a command, e.g.
+    ``find card {'_id': '?', 'owner': '?'}``, used to spot repeats.
+    """
+    collection = command.get(command_name)
+    if command_name == "find":
+        body = command.get("filter", {})
+    elif command_name == "aggregate":
+        body = [next(iter(stage), "?") for stage in command.get("pipeline", [])]
+    elif command_name in ("update", "delete"):
+        statements = command.get(command_name + "s") or [{}]
+        body = statements[0].get("q", {})
+    elif command_name in ("count", "distinct"):
+        body = command.get("query", {})
+    elif command_name == "findAndModify":
+        body = command.get("query", {})
+    else:
+        body = None
+    shape = (
+        f"{command_name} {collection}" if isinstance(collection, str) else command_name
+    )
+    return f"{shape} {_skeleton(body)}" if body is not None else shape
+
+
+class RequestProfile:
+    """Mongo commands issued while serving one request."""
+
+    def __init__(self, method: str, path: str):
+        self.method = method
+        self.path = path
+        self.started_at = time.time()
+        self.count = 0
+        self.failed = 0
+        self.total_ms = 0.0
+        self.slowest: list[dict] = []
+        self.shapes: Counter[str] = Counter()
+        self._pending: dict[int, str] = {}
+        self._lock = threading.Lock()
+
+    def command_started(self, request_id: int, shape: str) -> None:
+        with self._lock:
+            self._pending[request_id] = shape
+
+    def command_finished(
+        self, request_id: int, duration_ms: float, failed: bool
+    ) -> None:
+        with self._lock:
+            shape = self._pending.pop(request_id, "unknown")
+            self.count += 1
+            self.failed += failed
+            self.total_ms += duration_ms
+            self.shapes[shape] += 1
+            self.slowest.append({"shape": shape, "ms": round(duration_ms, 3)})
+            self.slowest.sort(key=lambda c: c["ms"], reverse=True)
+            del self.slowest[QUERY_PROFILER_SLOWEST:]
+
+    def repeated_shapes(self) -> dict[str, int]:
+        if QUERY_PROFILER_REPEAT_WARNING <= 0:
+            return {}
+        return {
+            shape: count
+            for shape, count in self.shapes.items()
+            if count >= QUERY_PROFILER_REPEAT_WARNING
+        }
+
+    def server_timing(self) -> str:
+        return f'db;dur={self.total_ms:.2f};desc="{self.count} mongo commands"'
+
+    def summary(self, status_code: int | None = None) -> dict:
+        return {
+            "method": self.method,
+            "path": self.path,
+            "status": status_code,
+            "started_at": self.started_at,
+            "commands": self.count,
+            "failed": self.failed,
+            "db_ms": round(self.total_ms, 3),
+            "slowest": list(self.slowest),
+            "repeated": self.repeated_shapes(),
+        }
+
+
+class CommandProfiler(monitoring.CommandListener):
+    """
+    Forwards command events to the profile of the request that issued
+    them. Commands run outside a profiled request are ignored.
+    """
+
+    def started(self, event):
+        profile = _current_profile.get()
+        if profile is not None:
+            profile.command_started(
+                event.request_id, command_shape(event.command_name, event.command)
+            )
+
+    def succeeded(self, event):
+        profile = _current_profile.get()
+        if profile is not None:
+            profile.command_finished(
+                event.request_id, event.duration_micros / 1000, False
+            )
+
+    def failed(self, event):
+        profile = _current_profile.get()
+        if profile is not None:
+            profile.command_finished(
+                event.request_id, event.duration_micros / 1000, True
+            )
+
+
+command_profiler = CommandProfiler()
+
+_recent = deque(maxlen=QUERY_PROFILER_HISTORY)
+_recent_lock = threading.Lock()
+
+
+def recent_queries() -> list[dict]:
+    """Profiles of the most recent requests, newest first."""
+    with _recent_lock:
+        return list(reversed(_recent))
+
+
+class QueryProfilerMiddleware:
+    """
+    ASGI middleware that opens a RequestProfile per HTTP request, adds the
+    Server-Timing header and, when ``keep_history`` is set, records the
+    profile for /debug/queries.
+    """
+
+    def __init__(self, app, keep_history: bool = False):
+        self.app = app
+        self.keep_history = keep_history
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not QUERY_PROFILER_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        profile = RequestProfile(scope["method"], scope["path"])
+        token = _current_profile.set(profile)
+        status_code = None
+
+        async def send_with_timing(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = list(message.get("headers", []))
+                headers.append(
+                    (b"server-timing", profile.server_timing().encode("latin-1"))
+                )
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current_profile.reset(token)
+            repeated = profile.repeated_shapes()
+            if repeated:
+                logger.warning(
+                    f"Possible N+1 on {profile.method} {profile.path}: "
+                    + ", ".join(
+                        f"{shape} x{count}" for shape, count in repeated.items()
+                    )
+                )
+            if self.keep_history:
+                with _recent_lock:
+                    _recent.append(profile.summary(status_code))
@@ -0,0 +1,31 @@
+from functools import lru_cache
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+
+@lru_cache(maxsize=None)
+def _adapter(schema_type) -> TypeAdapter:
+    return TypeAdapter(schema_type)
+
+
+def json_response(
+    schema_type, content, headers: dict | None = None, include=None
+) -> Response:
+    """
+    Serializes ``content`` as ``schema_type`` straight to JSON bytes with
+    pydantic-core. Returning a Response skips FastAPI's re-validation of
+    the payload against ``response_model``, which dominates large list
+    responses built from trusted raw documents. Keep ``response_model`` on
+    the route so the OpenAPI schema stays accurate.
+
+    ``include`` is passed to pydantic to trim the output to a sparse
+    fieldset (see crud.parse_fields).
+    """
+    return Response(
+        content=_adapter(schema_type).dump_json(
+            content, by_alias=True, include=include
+        ),
+        media_type="application/json",
+        headers=headers,
+    )
@@ -0,0 +1,132 @@
+"""
+Buffered, append-only writes of ReviewEvent documents.
+
+Reviews arrive in bursts: one per tap in a session, or hundreds at once
+when an offline queue drains. Instead of one insert per review, events
+are queued in process and written with a single insert_many once
+REVIEW_LOG_BATCH_SIZE are waiting or every REVIEW_LOG_FLUSH_MS, whichever
+comes first. The buffer is flushed on shutdown, so only a hard crash can
+lose events (at most one interval's worth).
+"""
+
+import os
+import threading
+
+from bson import ObjectId
+from pymongo.errors import BulkWriteError
+
+from ..models import ReviewEvent
+from .logger import logger
+
+REVIEW_LOG_BATCH_SIZE = int(os.getenv("REVIEW_LOG_BATCH_SIZE", "200"))
+REVIEW_LOG_FLUSH_MS = int(os.getenv("REVIEW_LOG_FLUSH_MS", "1000"))
+# Events kept while MongoDB is unreachable; the oldest are dropped beyond this.
+REVIEW_LOG_MAX_BUFFER = int(os.getenv("REVIEW_LOG_MAX_BUFFER", "10000"))
+
+_DUPLICATE_KEY = 11000
+
+
+class ReviewEventBuffer:
+    """
+    Thread-safe queue of review events with a background flusher thread.
+    Without a running flusher (scripts, tests) a full batch is written
+    inline by the caller of ``add``.
+    """
+
+    def __init__(self, batch_size: int, flush_ms: int, max_buffer: int):
+        self.batch_size = batch_size
+        self.flush_ms = flush_ms
+        self.max_buffer = max_buffer
+        self._events: list[dict] = []
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def add(self, events: list[ReviewEvent]) -> None:
+        if not events:
+            return
+        docs = []
+        for event in events:
+            event.validate()
+            doc = event.to_mongo().to_dict()
+            # Ids are fixed up front so a retried batch can't insert twice.
+            doc["_id"] = ObjectId()
+            docs.append(doc)
+        with self._lock:
+            self._events.extend(docs)
+            full = len(self._events) >= self.batch_size
+        if full:
+            if self._thread is not None and self._thread.is_alive():
+                self._wake.set()
+            else:
+                self.flush()
+
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._events)
+
+    def flush(self) -> int:
+        """Writes everything buffered; returns the number of events written."""
+        with self._flush_lock:
+            with self._lock:
+                docs, self._events = self._events, []
+            if not docs:
+                return 0
+            try:
+                ReviewEvent._get_collection().insert_many(docs, ordered=False)
+                return len(docs)
+            except BulkWriteError as e:
+                # Duplicate ids were written by an earlier, partly failed flush.
+                failed = {
+                    error["index"]
+                    for error in e.details.get("writeErrors", [])
+                    if error.get("code") != _DUPLICATE_KEY
+                }
+                retry = [docs[index] for index in sorted(failed)]
+            except Exception as e:
+                logger.error(f"Review log flush of {len(docs)} events failed: {e}")
+                retry = docs
+            self._requeue(retry)
+            return len(docs) - len(retry)
+
+    def _requeue(self, docs: list[dict]) -> None:
+        if not docs:
+            return
+        with self._lock:
+            self._events[:0] = docs
+            overflow = len(self._events) - self.max_buffer
+            if overflow > 0:
+                del self._events[:overflow]
+        if overflow > 0:
+            logger.warning(f"Review log buffer full, dropped {overflow} events")
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            self._wake.wait(self.flush_ms / 1000)
+            self._wake.clear()
+            self.flush()
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="review-log", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops the flusher thread and writes whatever is still buffered."""
+        self._stopping.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=10)
+            self._thread = None
+        self.flush()
+
+
+review_log = ReviewEventBuffer(
+    REVIEW_LOG_BATCH_SIZE, REVIEW_LOG_FLUSH_MS, REVIEW_LOG_MAX_BUFFER
+)
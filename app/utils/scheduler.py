@@ -0,0 +1,54 @@
+"""
+SM-2 style spaced-repetition scheduling.
+
+Each card keeps an interval (days until its next review) and an ease
+factor that scales the interval after every successful review. The
+review's hardness rating drives both: "hard" counts as a lapse and sends
+the card back to the first step, "medium" grows the interval by the ease
+and "easy" grows it further and raises the ease.
+"""
+
+import os
+from datetime import datetime, timedelta
+
+from ..schemas import HardnessLevel
+
+DEFAULT_EASE = float(os.getenv("SCHEDULER_DEFAULT_EASE", "2.5"))
+MIN_EASE = 1.3
+# Interval after the first review of a new card or after a lapse.
+FIRST_INTERVAL_DAYS = 1.0
+# Interval after a new card's first review when it was rated easy.
+EASY_FIRST_INTERVAL_DAYS = 4.0
+EASY_BONUS = 1.3
+MAX_INTERVAL_DAYS = float(os.getenv("SCHEDULER_MAX_INTERVAL_DAYS", "365"))
+
+
+def schedule_review(
+    hardness: HardnessLevel,
+    reviewed_at: datetime,
+    interval_days: float | None = None,
+    ease: float | None = None,
+) -> dict:
+    """
+    The card's scheduling state after a review, as the values to store:
+    ``next_due``, ``interval_days`` and ``ease``. Cards that were never
+    reviewed have no interval/ease yet and start from the defaults.
+    """
+    interval = interval_days or 0.0
+    ease = ease or DEFAULT_EASE
+    if hardness == HardnessLevel.HARD:
+        ease = max(MIN_EASE, ease - 0.2)
+        interval = FIRST_INTERVAL_DAYS
+    elif hardness == HardnessLevel.EASY:
+        ease += 0.15
+        interval = (
+            interval * ease * EASY_BONUS if interval else EASY_FIRST_INTERVAL_DAYS
+        )
+    else:
+        interval = interval * ease if interval else FIRST_INTERVAL_DAYS
+    interval = min(interval, MAX_INTERVAL_DAYS)
+    return {
+        "next_due": reviewed_at + timedelta(days=interval),
+        "interval_days": round(interval, 3),
+        "ease": round(ease, 3),
+    }
@@ -1,11 +1,73 @@
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import bcrypt
+from fastapi import HTTPException, status
+
+# bcrypt is deliberately slow, so hashing runs on its own small pool
+# instead of the shared anyio threadpool that serves every sync endpoint.
+# BCRYPT_MAX_PENDING bounds how many calls may queue behind the workers;
+# beyond that, login/register are rejected with 503 rather than piling up.
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+BCRYPT_MAX_WORKERS = int(os.getenv("BCRYPT_MAX_WORKERS", "2"))
+BCRYPT_MAX_PENDING = int(os.getenv("BCRYPT_MAX_PENDING", "32"))
+
+_executor = ThreadPoolExecutor(
+    max_workers=BCRYPT_MAX_WORKERS, thread_name_prefix="bcrypt"
+)
+_slots = threading.BoundedSemaphore(BCRYPT_MAX_WORKERS + BCRYPT_MAX_PENDING)
 
 
 def hash_password(password: str) -> str:
-    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+    return bcrypt.hashpw(
+        password.encode("utf-8"), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
+    ).decode("utf-8")
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return bcrypt.checkpw(
         plain_password.encode("utf-8"), hashed_password.encode("utf-8")
     )
+
+
+def needs_rehash(hashed_password: str) -> bool:
+    """
+    True when a stored hash was created with a different cost factor than
+    the configured BCRYPT_ROUNDS.
+    """
+    try:
+        return int(hashed_password.split("$")[2]) != BCRYPT_ROUNDS
+    except (IndexError, ValueError):
+        return True
+
+
+async def _run_bcrypt(fn, *args):
+    if not _slots.acquire(blocking=False):
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many concurrent login attempts, please retry shortly",
+            headers={"Retry-After": "1"},
+        )
+    try:
+        future = _executor.submit(fn, *args)
+    except BaseException:
+        _slots.release()
+        raise
+    future.add_done_callback(lambda _: _slots.release())
+    return await asyncio.wrap_future(future)
+
+
+async def hash_password_async(password: str) -> str:
+    """
+    Hashes a password on the bcrypt pool without blocking the event loop.
+    """
+    return await _run_bcrypt(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Checks a password on the bcrypt pool without blocking the event loop.
+    """
+    return await _run_bcrypt(verify_password, plain_password, hashed_password)
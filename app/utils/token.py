@@ -1,12 +1,16 @@
+import hashlib
+import os
+import time
 from datetime import datetime, timedelta, timezone
-from typing import Optional
 from jose import JWTError, jwt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from .security import verify_password
+from mongoengine import signals
+from pymongo.asynchronous.database import AsyncDatabase
 from .logger import logger
-from ..database import get_db
-from .. import crud
+from .cache import TTLCache
+from ..database import get_db, get_async_db
+from ..models import User
 
 # Secret key to encode JWT tokens
 # In production, use a more secure method to manage the secret key
@@ -14,6 +18,34 @@ SECRET_KEY = "your_secret_key_here"  # Replace with your secret key
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30  # Token validity
 
+# Authenticated users are cached by token subject so hot endpoints don't
+# hit Mongo just to resolve the caller. Entries are dropped whenever the
+# user document is saved or deleted; code that changes quota or
+# storage_config through atomic updates calls invalidate_user() itself.
+USER_CACHE_TTL_SECONDS = float(os.getenv("AUTH_USER_CACHE_TTL_SECONDS", "60"))
+USER_CACHE_MAX_ENTRIES = int(os.getenv("AUTH_USER_CACHE_MAX_ENTRIES", "10000"))
+
+_user_cache = TTLCache(maxsize=USER_CACHE_MAX_ENTRIES, ttl=USER_CACHE_TTL_SECONDS)
+
+# Verified token payloads, keyed by a digest of the raw token, so the
+# signature is only checked once per token and worker until it expires.
+TOKEN_CACHE_MAX_ENTRIES = int(os.getenv("AUTH_TOKEN_CACHE_MAX_ENTRIES", "10000"))
+
+_token_cache = TTLCache(maxsize=TOKEN_CACHE_MAX_ENTRIES)
+
+# Field projections loaded for the principal. Most endpoints only need to
+# know who the caller is; uploads also need the quota counters and the
+# storage routes need storage_config (which carries OAuth credentials).
+PRINCIPAL_FIELDS = ("id", "username")
+QUOTA_FIELDS = PRINCIPAL_FIELDS + (
+    "storage_used_bytes",
+    "file_count",
+    "max_files",
+    "max_storage_bytes",
+    "subscription_tier",
+)
+STORAGE_FIELDS = QUOTA_FIELDS + ("storage_config",)
+
 
 def create_access_token(data: dict, expires_delta: timedelta | None = None):
     """
@@ -33,33 +65,173 @@ def create_access_token(data: dict, expires_delta: timedelta | None = None):
 
 def verify_token(token: str, credentials_exception):
     """
-    Verifies a JWT token and returns the payload.
+    Verifies a JWT token and returns the payload. Successfully verified
+    payloads are cached until their ``exp`` claim.
     """
+    digest = hashlib.sha256(token.encode("utf-8")).digest()
+    payload = _token_cache.get(digest)
+    if payload is not None:
+        return payload
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         username: str = payload.get("sub")
         if username is None:
             raise credentials_exception
-        return payload
     except JWTError as e:
         logger.error(f"JWT Error: {str(e)}")
         raise credentials_exception
+    exp = payload.get("exp")
+    if exp is not None:
+        remaining = exp - time.time()
+        if remaining > 0:
+            _token_cache.set(digest, payload, ttl=remaining)
+    return payload
+
+
+def cache_stats() -> dict:
+    """
+    Hit/miss counters for the verified-token and principal caches.
+    """
+    return {"tokens": _token_cache.stats(), "users": _user_cache.stats()}
+
+
+def get_cached_user(
+    username: str, db: str = "default", fields: tuple[str, ...] = PRINCIPAL_FIELDS
+) -> User | None:
+    """
+    Returns the user for a token subject with only ``fields`` loaded,
+    served from the principal cache when possible. The returned document
+    is partial and must not be saved; use atomic updates instead.
+    """
+    key = (username, fields)
+    user = _user_cache.get(key)
+    if user is None:
+        user = User.objects(username=username).only(*fields).using(db).first()
+        if user is not None:
+            _user_cache.set(key, user)
+    return user
+
+
+async def get_cached_user_async(
+    username: str, db: AsyncDatabase, fields: tuple[str, ...] = PRINCIPAL_FIELDS
+) -> User | None:
+    """
+    Like get_cached_user, but a cache miss is read through the async
+    client, so async routes never block the event loop or a threadpool
+    worker on it. The same cache is shared with get_cached_user.
+    """
+    key = (username, fields)
+    user = _user_cache.get(key)
+    if user is None:
+        raw = await db[User._get_collection_name()].find_one(
+            {"username": username},
+            {"_id" if f == "id" else f: 1 for f in fields},
+        )
+        if raw is not None:
+            user = User._from_son(raw)
+            _user_cache.set(key, user)
+    return user
+
+
+def invalidate_user(username: str) -> None:
+    """
+    Drops a cached user so the next request reloads it from the database.
+    """
+    for fields in (PRINCIPAL_FIELDS, QUOTA_FIELDS, STORAGE_FIELDS):
+        _user_cache.pop((username, fields))
+
+
+def _invalidate_on_change(sender, document, **kwargs):
+    invalidate_user(document.username)
+
+
+signals.post_save.connect(_invalidate_on_change, sender=User)
+signals.post_delete.connect(_invalidate_on_change, sender=User)
 
 
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
 
-def get_current_user(token: str = Depends(oauth2_scheme), db: str = Depends(get_db)):
-    credentials_exception = HTTPException(
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    payload = verify_token(token, credentials_exception)
-    username: str = payload.get("sub")
-    if username is None:
-        raise credentials_exception
-    user = crud.get_user_by_username(username, db)
+
+
+def get_token_subject(token: str = Depends(oauth2_scheme)) -> str:
+    """
+    Verifies the bearer token and returns its subject. FastAPI caches
+    dependency results per request, so the token is only checked once
+    even when several principal dependencies are resolved.
+    """
+    return verify_token(token, _credentials_exception())["sub"]
+
+
+async def get_async_token_subject(token: str = Depends(oauth2_scheme)) -> str:
+    """
+    get_token_subject for async routes. Verification is CPU-only and its
+    result is cached per token, so it runs on the event loop.
+    """
+    return verify_token(token, _credentials_exception())["sub"]
+
+
+def _load_principal(
+    username: str, db: str, fields: tuple[str, ...], cached: bool = True
+) -> User:
+    if cached:
+        user = get_cached_user(username, db, fields)
+    else:
+        user = User.objects(username=username).only(*fields).using(db).first()
     if user is None:
-        raise credentials_exception
+        raise _credentials_exception()
     return user
+
+
+def get_current_user(
+    username: str = Depends(get_token_subject), db: str = Depends(get_db)
+) -> User:
+    """
+    Shared auth dependency. Loads only id and username, which is all the
+    CRUD endpoints need to scope queries by owner.
+    """
+    return _load_principal(username, db, PRINCIPAL_FIELDS)
+
+
+async def get_async_current_user(
+    username: str = Depends(get_async_token_subject),
+    db: AsyncDatabase = Depends(get_async_db),
+) -> User:
+    """
+    get_current_user for ``async def`` routes. A sync dependency would run
+    on the threadpool (and block a worker on a cache miss), so this one
+    resolves the principal on the event loop.
+    """
+    user = await get_cached_user_async(username, db, PRINCIPAL_FIELDS)
+    if user is None:
+        raise _credentials_exception()
+    return user
+
+
+def get_current_user_with_quota(
+    username: str = Depends(get_token_subject), db: str = Depends(get_db)
+) -> User:
+    """
+    Like get_current_user, but also loads the storage quota counters.
+    These are always read from the database, never from the principal
+    cache: a cached copy can be stale (and other workers' uploads never
+    invalidate it), so quota checks would let users exceed their limits.
+    """
+    return _load_principal(username, db, QUOTA_FIELDS, cached=False)
+
+
+def get_current_user_with_storage(
+    username: str = Depends(get_token_subject), db: str = Depends(get_db)
+) -> User:
+    """
+    Like get_current_user, but also loads storage_config. Served from the
+    principal cache, so the quota counters it carries may be stale; use
+    get_current_user_with_quota for quota checks.
+    """
+    return _load_principal(username, db, STORAGE_FIELDS)
@@ -0,0 +1,106 @@
+"""
+Encode time and bytes on the wire for deck responses of various sizes.
+
+Compares FastAPI's stock JSONResponse (jsonable_encoder + json.dumps),
+ORJSONResponse, and the pydantic-core path used by json_response(), then
+reports the payload size uncompressed, gzipped and brotli-compressed at
+the configured levels.
+
+    python -m benchmarks.responses [--sizes 50 500 2000] [--repeat 5]
+"""
+
+import argparse
+import gzip
+import time
+from datetime import datetime
+
+import brotli
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, ORJSONResponse
+
+from app import schemas
+from app.utils.compression import BROTLI_QUALITY, GZIP_LEVEL
+from app.utils.responses import json_response
+
+
+def make_deck(size: int) -> schemas.Deck:
+    now = datetime.utcnow()
+    cards = [
+        schemas.Card(
+            id=f"{i:024x}",
+            front=f"das Wort {i}",
+            back=f"the word {i}",
+            example_original=f"Das ist das Wort {i} in einem Satz.",
+            example_translation=f"This is word {i} in a sentence.",
+            examples=[
+                schemas.ExampleSentenceSchema(
+                    sentence=f"Beispielsatz {j} für Wort {i}.",
+                    translation=f"Example sentence {j} for word {i}.",
+                )
+                for j in range(2)
+            ],
+            synonyms=["Begriff", "Ausdruck"],
+            antonyms=[],
+            part_of_speech="noun",
+            gender="neuter",
+            plural_form="Wörter",
+            pronunciation="vɔʁt",
+            notes="Common noun, frequently used.",
+            tags=["a1", "book-1", f"chapter-{i % 12}"],
+            hardness_level=schemas.HardnessLevel.MEDIUM,
+            custom_fields={},
+            date_created=now,
+            last_edited=now,
+        )
+        for i in range(size)
+    ]
+    return schemas.Deck(
+        id="0" * 24, name=f"Deck {size}", description="Benchmark", cards=cards
+    )
+
+
+def _time(fn, repeat: int) -> tuple[float, bytes]:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        body = fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000, body
+
+
+def run(sizes: list[int], repeat: int) -> None:
+    encoders = {
+        "JSONResponse": lambda deck: JSONResponse(jsonable_encoder(deck)).body,
+        "ORJSONResponse": lambda deck: ORJSONResponse(jsonable_encoder(deck)).body,
+        "json_response": lambda deck: json_response(schemas.Deck, deck).body,
+    }
+    print(f"{'cards':>6} {'encoder':<15} {'encode ms':>10}")
+    for size in sizes:
+        deck = make_deck(size)
+        body = b""
+        for name, encode in encoders.items():
+            ms, body = _time(lambda: encode(deck), repeat)
+            print(f"{size:>6} {name:<15} {ms:>10.2f}")
+
+        gzip_ms, gzipped = _time(lambda: gzip.compress(body, GZIP_LEVEL), repeat)
+        br_ms, compressed = _time(
+            lambda: brotli.compress(body, quality=BROTLI_QUALITY), repeat
+        )
+        print(
+            f"{size:>6} bytes: raw {len(body):,}  "
+            f"gzip-{GZIP_LEVEL} {len(gzipped):,} ({gzip_ms:.2f} ms)  "
+            f"br-{BROTLI_QUALITY} {len(compressed):,} ({br_ms:.2f} ms)"
+        )
+        print()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[50, 500, 2000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+    run(args.sizes, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
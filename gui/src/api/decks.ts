@@ -1,8 +1,8 @@
 import apiClient from './client'
-import type { Deck, DeckCreate, DeckUpdate } from '../types'
+import type { Deck, DeckCreate, DeckSummary, DeckUpdate } from '../types'
 
-export async function listDecks(skip = 0, limit = 20): Promise<Deck[]> {
-  const { data } = await apiClient.get<Deck[]>('/decks/', {
+export async function listDecks(skip = 0, limit = 20): Promise<DeckSummary[]> {
+  const { data } = await apiClient.get<DeckSummary[]>('/decks/', {
     params: { skip, limit },
   })
   return data
@@ -4,10 +4,10 @@ import CardActionArea from '@mui/material/CardActionArea'
 import Typography from '@mui/material/Typography'
 import Chip from '@mui/material/Chip'
 import Box from '@mui/material/Box'
-import type { Deck } from '../../types'
+import type { DeckSummary } from '../../types'
 
 interface DeckListItemProps {
-  deck: Deck
+  deck: DeckSummary
   onClick: () => void
 }
 
@@ -28,7 +28,7 @@ export default function DeckListItem({ deck, onClick }: DeckListItemProps) {
               {deck.name}
             </Typography>
             <Chip
-              label={`${deck.cards.length} cards`}
+              label={`${deck.card_count} cards`}
               size="small"
               color="primary"
               variant="outlined"
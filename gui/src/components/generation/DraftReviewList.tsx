@@ -30,7 +30,7 @@ import type {
   DraftCardResponse,
   DraftCardUpdate,
   DraftCardStatus,
-  Deck,
+  DeckSummary,
 } from '../../types'
 
 interface DraftReviewListProps {
@@ -231,8 +231,8 @@ export default function DraftReviewList({ bookId }: DraftReviewListProps) {
               <Autocomplete
                 size="small"
                 options={decks ?? []}
-                getOptionLabel={(option: Deck) => option.name}
-                value={decks?.find((d: Deck) => d.id === bulkDeckId) ?? null}
+                getOptionLabel={(option: DeckSummary) => option.name}
+                value={decks?.find((d: DeckSummary) => d.id === bulkDeckId) ?? null}
                 onChange={(_, v) => setBulkDeckId(v?.id ?? null)}
                 sx={{ minWidth: 200 }}
                 renderInput={(params) => (
@@ -127,6 +127,14 @@ export interface Deck {
   cards: Card[]
 }
 
+export interface DeckSummary {
+  id: string
+  name: string
+  description?: string | null
+  card_count: number
+  last_edited?: string | null
+}
+
 export interface DeckCreate {
   name: string
   description?: string
@@ -69,6 +69,21 @@ class CardsApi {
     }
   }
 
+  /// Submits reviews in one request; each one advances its card's
+  /// schedule. The server reports a result per review, but none of them
+  /// (applied, stale, unknown card) is worth retrying, so the batch is
+  /// settled once the request succeeds.
+  Future<void> review(List<CardReview> reviews) async {
+    try {
+      await _client.dio.post<Object?>(
+        '/cards/reviews',
+        data: {'reviews': reviews.map((r) => r.toJson()).toList()},
+      );
+    } on DioException catch (e) {
+      throw _toApi(e);
+    }
+  }
+
   Future<void> delete(String id) async {
     try {
       await _client.dio.delete<Object?>('/cards/$id');
@@ -14,7 +14,9 @@ class DecksApi {
     try {
       final response = await _client.dio.get<Object?>(
         '/decks/',
-        queryParameters: {'skip': skip, 'limit': limit},
+        // Full view: the deck list is also snapshotted into the offline
+        // card cache, which needs every deck's cards.
+        queryParameters: {'skip': skip, 'limit': limit, 'view': 'full'},
       );
       return decodeResponse(response, (data) {
         final list = (data as List<Object?>?) ?? const [];
@@ -19,6 +19,9 @@ import 'app_database.dart';
 class CardCacheService {
   CardCacheService(this._db, this._readCardsApi);
 
+  /// Matches the server's cap on reviews per `POST /cards/reviews`.
+  static const _maxReviewsPerRequest = 500;
+
   final AppDatabase _db;
   final dynamic Function() _readCardsApi;
 
@@ -52,9 +55,10 @@ class CardCacheService {
     return rows.map(_rowToCard).toList(growable: false);
   }
 
-  /// Optimistically updates the cached row and enqueues the server-side
-  /// update for replay. Safe to call when offline — the API call will
-  /// be retried by [drainPending].
+  /// Optimistically updates the cached row and enqueues the review for
+  /// replay. Safe to call when offline — the API call will be retried by
+  /// [drainPending]. Rating a card again before the queue drains keeps
+  /// only the latest review.
   Future<void> recordHardness(String cardId, model.HardnessLevel level) async {
     await _db.transaction(() async {
       await (_db.update(_db.cachedCards)..where((c) => c.id.equals(cardId)))
@@ -63,35 +67,55 @@ class CardCacheService {
             PendingCardUpdatesCompanion.insert(
               cardId: cardId,
               hardnessLevel: level.wire,
+              queuedAt: Value(DateTime.now()),
             ),
           );
     });
   }
 
-  /// Replays pending updates against the server. Successful updates are
-  /// removed from the queue; the first failure short-circuits the rest
-  /// so we don't spam a flaky network. Returns the number of updates
-  /// that successfully synced.
+  /// Replays pending reviews against `POST /cards/reviews`, in batches of
+  /// at most [_maxReviewsPerRequest]. Each synced batch is removed from
+  /// the queue; the first failure stops the drain and leaves that batch
+  /// and the rest queued. Returns the number of reviews synced.
   Future<int> drainPending() async {
-    final pending = await _db.select(_db.pendingCardUpdates).get();
+    final pending = await (_db.select(_db.pendingCardUpdates)
+          ..orderBy([(p) => OrderingTerm(expression: p.queuedAt)]))
+        .get();
     if (pending.isEmpty) return 0;
 
     final api = _readCardsApi();
     var synced = 0;
-    for (final entry in pending) {
+    for (var start = 0;
+        start < pending.length;
+        start += _maxReviewsPerRequest) {
+      final batch = pending
+          .skip(start)
+          .take(_maxReviewsPerRequest)
+          .toList(growable: false);
       try {
-        await api.update(
-          entry.cardId,
-          model.CardUpdate(
-              hardnessLevel: model.HardnessLevel.fromWire(entry.hardnessLevel)),
-        );
-        await (_db.delete(_db.pendingCardUpdates)
-              ..where((p) => p.cardId.equals(entry.cardId)))
-            .go();
-        synced += 1;
+        await api.review(<model.CardReview>[
+          for (final entry in batch)
+            model.CardReview(
+              cardId: entry.cardId,
+              hardnessLevel: model.HardnessLevel.fromWire(entry.hardnessLevel),
+              clientTs: entry.queuedAt,
+            ),
+        ]);
       } on Object {
         return synced;
       }
+      await _db.transaction(() async {
+        for (final entry in batch) {
+          // A card rated again while the request was in flight was
+          // re-queued with a newer queuedAt; keep that review.
+          await (_db.delete(_db.pendingCardUpdates)
+                ..where((p) =>
+                    p.cardId.equals(entry.cardId) &
+                    p.queuedAt.equals(entry.queuedAt)))
+              .go();
+        }
+      });
+      synced += batch.length;
     }
     return synced;
   }
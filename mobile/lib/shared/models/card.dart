@@ -245,3 +245,23 @@ class CardUpdate {
         'custom_fields': customFields,
       });
 }
+
+/// One review for `POST /cards/reviews`. [clientTs] is when the review
+/// happened on the device; the server keeps the newest one per card.
+class CardReview {
+  const CardReview({
+    required this.cardId,
+    required this.hardnessLevel,
+    required this.clientTs,
+  });
+
+  final String cardId;
+  final HardnessLevel hardnessLevel;
+  final DateTime clientTs;
+
+  JsonMap toJson() => {
+        'card_id': cardId,
+        'hardness_level': hardnessLevel.wire,
+        'client_ts': clientTs.toUtc().toIso8601String(),
+      };
+}
@@ -9,21 +9,13 @@ class _FakeCardsApi {
   _FakeCardsApi({this.failOn = const {}});
 
   final Set<String> failOn;
-  final List<({String id, HardnessLevel level})> calls = [];
+  final List<List<CardReview>> batches = [];
 
-  Future<Card> update(String id, CardUpdate input) async {
-    calls.add((id: id, level: input.hardnessLevel ?? HardnessLevel.medium));
-    if (failOn.contains(id)) {
+  Future<void> review(List<CardReview> reviews) async {
+    batches.add(reviews);
+    if (reviews.any((r) => failOn.contains(r.cardId))) {
       throw Exception('simulated server error');
     }
-    return Card(
-      id: id,
-      front: 'f',
-      back: 'b',
-      hardnessLevel: input.hardnessLevel ?? HardnessLevel.medium,
-      dateCreated: DateTime.now(),
-      lastEdited: DateTime.now(),
-    );
   }
 }
 
@@ -106,12 +98,13 @@ void main() {
 
     final synced = await stack.cache.drainPending();
     expect(synced, 1);
-    expect(stack.api.calls.single.id, 'c1');
-    expect(stack.api.calls.single.level, HardnessLevel.hard);
+    final review = stack.api.batches.single.single;
+    expect(review.cardId, 'c1');
+    expect(review.hardnessLevel, HardnessLevel.hard);
     expect(await stack.cache.pendingCount(), 0);
   });
 
-  test('drainPending stops on first failure and leaves rest queued',
+  test('drainPending sends one batch and keeps it queued on failure',
       () async {
     final stack = _makeStack(failOn: {'c2'});
     addTearDown(stack.db.close);
@@ -155,8 +148,29 @@ void main() {
     await stack.cache.recordHardness('c3', HardnessLevel.easy);
 
     final synced = await stack.cache.drainPending();
-    expect(synced, 1, reason: 'c1 succeeded; c2 failed and stopped the drain');
-    expect(await stack.cache.pendingCount(), 2,
-        reason: 'c2 + c3 still queued for next attempt');
+    expect(synced, 0, reason: 'c2 failed the batch request');
+    expect(stack.api.batches.single, hasLength(3),
+        reason: 'all queued reviews go in one request');
+    expect(await stack.cache.pendingCount(), 3,
+        reason: 'the whole batch stays queued for the next attempt');
+  });
+
+  test('re-rating before the drain sends only the latest review', () async {
+    final stack = _makeStack();
+    addTearDown(stack.db.close);
+    try {
+      await stack.db.customSelect('SELECT 1').get();
+    } catch (e) {
+      markTestSkipped('native sqlite unavailable: $e');
+      return;
+    }
+
+    await stack.cache.recordHardness('c1', HardnessLevel.hard);
+    await stack.cache.recordHardness('c1', HardnessLevel.easy);
+    expect(await stack.cache.pendingCount(), 1);
+
+    expect(await stack.cache.drainPending(), 1);
+    expect(stack.api.batches.single.single.hardnessLevel, HardnessLevel.easy);
+    expect(await stack.cache.pendingCount(), 0);
   });
 }
@@ -0,0 +1,103 @@
+import pytest
+
+from app.utils import cache as cache_module
+from app.utils.cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(cache_module, "time", clock)
+    return clock
+
+
+def test_get_returns_default_on_miss(clock):
+    cache = TTLCache(maxsize=2, ttl=10)
+    assert cache.get("a") is None
+    assert cache.get("a", "fallback") == "fallback"
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = TTLCache(maxsize=2, ttl=10)
+    cache.set("a", 1)
+    clock.now += 9.9
+    assert cache.get("a") == 1
+    clock.now += 0.1
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_per_entry_ttl_overrides_default(clock):
+    cache = TTLCache(maxsize=2, ttl=10)
+    cache.set("short", 1, ttl=1)
+    cache.set("long", 2)
+    clock.now += 5
+    assert cache.get("short") is None
+    assert cache.get("long") == 2
+
+
+def test_least_recently_used_entry_is_evicted(clock):
+    cache = TTLCache(maxsize=2, ttl=10)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    # Reading "a" makes "b" the least recently used.
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_overwriting_refreshes_recency_and_expiry(clock):
+    cache = TTLCache(maxsize=2, ttl=10)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    clock.now += 8
+    cache.set("a", 10)
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    clock.now += 8
+    assert cache.get("a") == 10
+
+
+def test_zero_maxsize_disables_caching(clock):
+    cache = TTLCache(maxsize=0, ttl=10)
+    cache.set("a", 1)
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_pop_and_clear(clock):
+    cache = TTLCache(maxsize=3, ttl=10)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.pop("a")
+    cache.pop("missing")
+    assert cache.get("a") is None
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_stats_count_hits_misses_and_expired_reads(clock):
+    cache = TTLCache(maxsize=2, ttl=10)
+    assert cache.stats()["hit_ratio"] == 0.0
+    cache.set("a", 1)
+    cache.get("a")
+    cache.get("b")
+    clock.now += 10
+    cache.get("a")
+    assert cache.stats() == {
+        "size": 0,
+        "maxsize": 2,
+        "hits": 1,
+        "misses": 2,
+        "hit_ratio": 0.3333,
+    }
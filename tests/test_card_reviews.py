@@ -0,0 +1,70 @@
+from datetime import datetime, timedelta
+
+import mongoengine
+import mongomock
+import pytest
+
+from app import crud, schemas
+from app.models import Card, User
+from app.utils.review_log import review_log
+
+
+@pytest.fixture
+def owner():
+    mongoengine.connect(
+        "test",
+        alias="default",
+        mongo_client_class=mongomock.MongoClient,
+        uuidRepresentation="standard",
+    )
+    user = User(username="reviewer", email="r@example.com", hashed_password="x")
+    user.save()
+    yield user
+    review_log.flush()
+    mongoengine.disconnect(alias="default")
+
+
+def _review(card, hardness, client_ts):
+    return schemas.CardReviewUpdate(
+        card_id=str(card.id), hardness_level=hardness, client_ts=client_ts
+    )
+
+
+def test_same_rating_reviews_keep_advancing(owner):
+    card = Card(front="f", back="b", owner=owner).save()
+    assert card.hardness_level == schemas.HardnessLevel.MEDIUM
+    start = datetime(2026, 1, 1)
+    intervals = []
+    for day in range(3):
+        result = crud.apply_card_reviews(
+            [_review(card, "medium", start + timedelta(days=day))], owner=owner
+        )
+        assert result.results[0].status == schemas.BulkItemStatus.UPDATED
+        card.reload()
+        intervals.append(card.interval_days)
+    assert intervals == sorted(set(intervals))
+    assert card.next_due > start + timedelta(days=2)
+    assert review_log.pending() == 3
+
+
+def test_older_review_is_stale(owner):
+    card = Card(front="f", back="b", owner=owner).save()
+    crud.apply_card_reviews([_review(card, "easy", datetime(2026, 1, 2))], owner=owner)
+    result = crud.apply_card_reviews(
+        [_review(card, "hard", datetime(2026, 1, 1))], owner=owner
+    )
+    assert result.results[0].status == schemas.BulkItemStatus.STALE
+    card.reload()
+    assert card.hardness_level == schemas.HardnessLevel.EASY
+
+
+def test_put_does_not_reschedule(owner):
+    card = Card(front="f", back="b", owner=owner).save()
+    due = card.reload().next_due
+    crud.update_card(
+        str(card.id), schemas.CardUpdate(hardness_level="easy"), owner=owner
+    )
+    card.reload()
+    assert card.hardness_level == schemas.HardnessLevel.EASY
+    assert card.next_due == due
+    assert card.interval_days is None
@@ -0,0 +1,99 @@
+import asyncio
+
+import pytest
+from bson import ObjectId
+from fastapi import HTTPException
+from mongomock_motor import AsyncMongoMockClient
+
+from app.async_crud import _keyset_page
+from app.crud import parse_cursor, parse_offset_cursor
+
+OWNER = ObjectId()
+OTHER = ObjectId()
+
+
+def test_parse_cursor():
+    oid = ObjectId()
+    assert parse_cursor(None) is None
+    assert parse_cursor("") is None
+    assert parse_cursor(str(oid)) == oid
+    with pytest.raises(HTTPException) as exc:
+        parse_cursor("not-an-id")
+    assert exc.value.status_code == 400
+
+
+def test_parse_offset_cursor():
+    assert parse_offset_cursor(None) == 0
+    assert parse_offset_cursor("") == 0
+    assert parse_offset_cursor("25") == 25
+    for bad in ("-1", "x", "1.5"):
+        with pytest.raises(HTTPException) as exc:
+            parse_offset_cursor(bad)
+        assert exc.value.status_code == 400
+
+
+def _collection(count: int):
+    collection = AsyncMongoMockClient()["test"]["cards"]
+    ids = sorted(ObjectId() for _ in range(count))
+    docs = [{"_id": oid, "owner": OWNER, "front": str(i)} for i, oid in enumerate(ids)]
+    # Another user's cards interleaved by _id must never show up.
+    docs += [{"_id": ObjectId(), "owner": OTHER, "front": "x"} for _ in range(count)]
+
+    async def insert():
+        await collection.insert_many(docs)
+
+    asyncio.run(insert())
+    return collection, ids
+
+
+def _page(collection, limit, cursor=None, skip=0):
+    return asyncio.run(
+        _keyset_page(collection, {"owner": OWNER}, ("id", "front"), skip, limit, cursor)
+    )
+
+
+def test_cursor_walk_visits_every_document_once():
+    collection, ids = _collection(7)
+    seen, cursor, pages = [], None, 0
+    while True:
+        raws, cursor = _page(collection, 3, cursor)
+        seen += [raw["_id"] for raw in raws]
+        pages += 1
+        if cursor is None:
+            break
+    assert seen == ids
+    assert pages == 3
+
+
+def test_next_cursor_is_the_last_returned_id():
+    collection, ids = _collection(4)
+    raws, cursor = _page(collection, 3)
+    assert [raw["_id"] for raw in raws] == ids[:3]
+    assert cursor == str(ids[2])
+
+
+def test_full_last_page_has_no_next_cursor():
+    collection, ids = _collection(6)
+    raws, cursor = _page(collection, 3, str(ids[2]))
+    assert [raw["_id"] for raw in raws] == ids[3:]
+    assert cursor is None
+
+
+def test_skip_applies_after_the_cursor():
+    collection, ids = _collection(6)
+    raws, cursor = _page(collection, 2, str(ids[0]), skip=1)
+    assert [raw["_id"] for raw in raws] == ids[2:4]
+    assert cursor == str(ids[3])
+
+
+def test_projection_limits_fields():
+    collection, _ = _collection(1)
+    raws, _ = _page(collection, 5)
+    assert set(raws[0]) == {"_id", "front"}
+
+
+def test_invalid_cursor_is_rejected():
+    collection, _ = _collection(1)
+    with pytest.raises(HTTPException) as exc:
+        _page(collection, 5, "zz")
+    assert exc.value.status_code == 400
@@ -0,0 +1,126 @@
+from datetime import datetime
+
+import pytest
+from bson import ObjectId
+from pymongo.errors import BulkWriteError
+
+from app.models import ReviewEvent, User
+from app.schemas import HardnessLevel
+from app.utils.review_log import ReviewEventBuffer
+
+OWNER = User(id=ObjectId(), username="reviewer")
+
+
+class FakeCollection:
+    """Records insert_many calls and fails them on demand."""
+
+    def __init__(self):
+        self.inserted: list[dict] = []
+        self.calls: list[list[dict]] = []
+        self.fail_with: Exception | None = None
+
+    def insert_many(self, docs, ordered=True):
+        self.calls.append(list(docs))
+        if self.fail_with is not None:
+            error, self.fail_with = self.fail_with, None
+            raise error
+        self.inserted.extend(docs)
+
+
+@pytest.fixture
+def collection(monkeypatch):
+    collection = FakeCollection()
+    monkeypatch.setattr(ReviewEvent, "_get_collection", lambda: collection)
+    return collection
+
+
+def _events(count: int) -> list[ReviewEvent]:
+    return [
+        ReviewEvent(
+            owner=OWNER,
+            card_id=ObjectId(),
+            hardness_level=HardnessLevel.EASY,
+            ts=datetime(2026, 1, 1, 0, i),
+        )
+        for i in range(count)
+    ]
+
+
+def test_events_wait_for_a_full_batch(collection):
+    buffer = ReviewEventBuffer(batch_size=3, flush_ms=1000, max_buffer=100)
+    buffer.add(_events(2))
+    assert buffer.pending() == 2
+    assert collection.calls == []
+    buffer.add(_events(1))
+    assert buffer.pending() == 0
+    assert len(collection.calls) == 1
+    assert len(collection.inserted) == 3
+
+
+def test_flush_writes_everything_buffered(collection):
+    buffer = ReviewEventBuffer(batch_size=100, flush_ms=1000, max_buffer=100)
+    buffer.add(_events(2))
+    assert buffer.flush() == 2
+    assert buffer.flush() == 0
+    assert [doc["hardness_level"] for doc in collection.inserted] == ["easy", "easy"]
+
+
+def test_failed_flush_requeues_with_the_same_ids(collection):
+    buffer = ReviewEventBuffer(batch_size=100, flush_ms=1000, max_buffer=100)
+    buffer.add(_events(3))
+    collection.fail_with = RuntimeError("down")
+    assert buffer.flush() == 0
+    assert buffer.pending() == 3
+    first_ids = [doc["_id"] for doc in collection.calls[0]]
+    assert buffer.flush() == 3
+    assert [doc["_id"] for doc in collection.calls[1]] == first_ids
+
+
+def test_partial_failure_retries_only_failed_events(collection):
+    buffer = ReviewEventBuffer(batch_size=100, flush_ms=1000, max_buffer=100)
+    buffer.add(_events(4))
+    collection.fail_with = BulkWriteError(
+        {
+            "writeErrors": [
+                # Already written by an earlier, partly failed flush.
+                {"index": 0, "code": 11000, "errmsg": "duplicate key"},
+                {"index": 2, "code": 91, "errmsg": "shutdown in progress"},
+            ]
+        }
+    )
+    assert buffer.flush() == 3
+    assert buffer.pending() == 1
+    failed_id = collection.calls[0][2]["_id"]
+    assert buffer.flush() == 1
+    assert [doc["_id"] for doc in collection.calls[1]] == [failed_id]
+
+
+def test_requeued_events_stay_ahead_of_newer_ones(collection):
+    buffer = ReviewEventBuffer(batch_size=100, flush_ms=1000, max_buffer=100)
+    buffer.add(_events(2))
+    collection.fail_with = RuntimeError("down")
+    buffer.flush()
+    old_ids = [doc["_id"] for doc in collection.calls[0]]
+    buffer.add(_events(1))
+    buffer.flush()
+    assert [doc["_id"] for doc in collection.calls[1]][:2] == old_ids
+
+
+def test_overflow_drops_the_oldest_events(collection):
+    buffer = ReviewEventBuffer(batch_size=100, flush_ms=1000, max_buffer=3)
+    buffer.add(_events(5))
+    collection.fail_with = RuntimeError("down")
+    buffer.flush()
+    kept = [doc["_id"] for doc in collection.calls[0][2:]]
+    assert buffer.pending() == 3
+    buffer.flush()
+    assert [doc["_id"] for doc in collection.calls[1]] == kept
+
+
+def test_stop_flushes_what_is_left(collection):
+    buffer = ReviewEventBuffer(batch_size=100, flush_ms=10_000, max_buffer=100)
+    buffer.start()
+    buffer.add(_events(2))
+    buffer.stop()
+    assert buffer.pending() == 0
+    assert len(collection.inserted) == 2
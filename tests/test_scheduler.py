@@ -0,0 +1,77 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.schemas import HardnessLevel
+from app.utils.scheduler import (
+    DEFAULT_EASE,
+    EASY_BONUS,
+    EASY_FIRST_INTERVAL_DAYS,
+    FIRST_INTERVAL_DAYS,
+    MAX_INTERVAL_DAYS,
+    MIN_EASE,
+    schedule_review,
+)
+
+NOW = datetime(2026, 1, 1, 12, 0)
+
+
+def test_new_card_medium_starts_at_first_interval():
+    state = schedule_review(HardnessLevel.MEDIUM, NOW)
+    assert state == {
+        "next_due": NOW + timedelta(days=FIRST_INTERVAL_DAYS),
+        "interval_days": FIRST_INTERVAL_DAYS,
+        "ease": DEFAULT_EASE,
+    }
+
+
+def test_new_card_easy_skips_ahead_and_raises_ease():
+    state = schedule_review(HardnessLevel.EASY, NOW)
+    assert state["interval_days"] == EASY_FIRST_INTERVAL_DAYS
+    assert state["ease"] == pytest.approx(DEFAULT_EASE + 0.15)
+    assert state["next_due"] == NOW + timedelta(days=EASY_FIRST_INTERVAL_DAYS)
+
+
+def test_medium_grows_interval_by_ease():
+    state = schedule_review(HardnessLevel.MEDIUM, NOW, interval_days=4.0, ease=2.5)
+    assert state["interval_days"] == 10.0
+    assert state["ease"] == 2.5
+
+
+def test_easy_grows_interval_with_bonus():
+    state = schedule_review(HardnessLevel.EASY, NOW, interval_days=4.0, ease=2.5)
+    assert state["ease"] == pytest.approx(2.65)
+    assert state["interval_days"] == pytest.approx(round(4.0 * 2.65 * EASY_BONUS, 3))
+
+
+def test_hard_is_a_lapse():
+    state = schedule_review(HardnessLevel.HARD, NOW, interval_days=30.0, ease=2.5)
+    assert state["interval_days"] == FIRST_INTERVAL_DAYS
+    assert state["ease"] == pytest.approx(2.3)
+
+
+def test_ease_never_drops_below_minimum():
+    state = schedule_review(HardnessLevel.HARD, NOW, interval_days=1.0, ease=MIN_EASE)
+    assert state["ease"] == MIN_EASE
+
+
+def test_interval_is_capped():
+    state = schedule_review(
+        HardnessLevel.EASY, NOW, interval_days=MAX_INTERVAL_DAYS, ease=3.0
+    )
+    assert state["interval_days"] == MAX_INTERVAL_DAYS
+    assert state["next_due"] == NOW + timedelta(days=MAX_INTERVAL_DAYS)
+
+
+def test_repeated_same_rating_keeps_advancing():
+    # Reviewing a card with the rating it already has must still move it
+    # forward; a schedule that only reacts to changed ratings never does.
+    interval, ease, reviewed_at = None, None, NOW
+    due_dates = []
+    for _ in range(4):
+        state = schedule_review(HardnessLevel.MEDIUM, reviewed_at, interval, ease)
+        interval, ease = state["interval_days"], state["ease"]
+        reviewed_at = state["next_due"]
+        due_dates.append(reviewed_at)
+    assert due_dates == sorted(set(due_dates))
+    assert interval > FIRST_INTERVAL_DAYS